@@ -471,9 +471,9 @@ class Data(Base, SerializationMixin):
             raise NotImplementedError(
                 "Relativization is not supported for data with step columns."
             )
-        df = self.df.copy()
+        # `relativize_dataframe` builds a new frame and never mutates its input.
         df_rel = relativize_dataframe(
-            df=df,
+            df=self.df,
             status_quo_name=status_quo_name,
             as_percent=as_percent,
             include_sq=include_sq,
@@ -736,56 +736,68 @@ def relativize_dataframe(
     )
     metric_names_set = set(metric_names) if metric_names is not None else None
 
-    grouped_df = df.groupby(grp_cols)
-    dfs = []
-    for grp in grouped_df.groups.keys():
-        subgroup_df = grouped_df.get_group(grp)
-
-        # If metric scoping is requested, skip relativization for excluded
-        # metrics and pass through raw data (with or without SQ row).
-        if metric_names_set is not None and "metric_name" in grp_cols:
-            grp_metric = (
-                # pyrefly: ignore [bad-index]
-                grp if isinstance(grp, str) else grp[grp_cols.index("metric_name")]
-            )
-            if grp_metric not in metric_names_set:
-                if include_sq:
-                    dfs.append(subgroup_df)
-                else:
-                    dfs.append(subgroup_df[subgroup_df["arm_name"] != status_quo_name])
-                continue
+    # Order rows the way iterating over ``df.groupby(grp_cols)`` would: groups
+    # sorted by key, rows with a missing key dropped, and input order kept
+    # within each group.
+    df = df.dropna(subset=grp_cols).sort_values(grp_cols, kind="stable")
+    is_sq = (df["arm_name"] == status_quo_name).to_numpy()
+    # If metric scoping is requested, excluded metrics are passed through raw.
+    if metric_names_set is not None and "metric_name" in grp_cols:
+        in_scope = df["metric_name"].isin(metric_names_set).to_numpy()
+    else:
+        in_scope = np.ones(len(df), dtype=bool)
+
+    # Attach each group's status quo (mean, sem) to all of its rows, so that all
+    # groups are relativized in a single vectorized call. Out-of-scope metrics are
+    # passed through untouched, so their status quo rows are not considered.
+    sq_df = df.loc[is_sq & in_scope, grp_cols + ["mean", "sem"]].drop_duplicates()
+    if sq_df.duplicated(subset=grp_cols).any():
+        raise ValueError(
+            f"Found multiple distinct observations of status quo '{status_quo_name}' "
+            "within a single trial and metric."
+        )
+    df_rel = df.merge(
+        sq_df.rename(columns={"mean": "_sq_mean", "sem": "_sq_sem"}),
+        on=grp_cols,
+        how="left",
+        indicator="_sq_found",
+    )
+    has_sq = (df_rel["_sq_found"] == "both").to_numpy()
+    missing_sq = in_scope & ~has_sq
+    if missing_sq.any():
+        # No status quo in these groups - skip relativization and include raw data
+        logger.debug(
+            "Status quo '%s' not found in trial groups %s - "
+            "skipping relativization for these groups",
+            status_quo_name,
+            df_rel.loc[missing_sq, grp_cols].drop_duplicates().values.tolist(),
+        )
 
-        is_sq = subgroup_df["arm_name"] == status_quo_name
-
-        # Check if status quo exists in this subgroup (trial)
-        sq_data = subgroup_df[is_sq][["mean", "sem"]].drop_duplicates().values
-        if len(sq_data) == 0:
-            # No status quo in this trial - skip relativization and include raw data
-            logger.debug(
-                "Status quo '%s' not found in trial group %s - "
-                "skipping relativization for this group",
-                status_quo_name,
-                grp,
+    to_relativize = in_scope & has_sq
+    if to_relativize.any():
+        means = df_rel["mean"].to_numpy(dtype=float, copy=True)
+        sems = df_rel["sem"].to_numpy(dtype=float, copy=True)
+        sq_means = df_rel["_sq_mean"].to_numpy(dtype=float)
+        sq_sems = df_rel["_sq_sem"].to_numpy(dtype=float)
+        # `relativize_func` only applies bias correction if the control SEM is
+        # not NaN, so rows with and without a NaN status quo SEM are relativized
+        # in separate calls.
+        sq_sem_is_nan = np.isnan(sq_sems)
+        for rows in (to_relativize & sq_sem_is_nan, to_relativize & ~sq_sem_is_nan):
+            if not rows.any():
+                continue
+            means[rows], sems[rows] = relativize_func(
+                means_t=means[rows],
+                sems_t=sems[rows],
+                mean_c=sq_means[rows],
+                sem_c=sq_sems[rows],
+                as_percent=as_percent,
+                bias_correction=bias_correction,
+                control_as_constant=control_as_constant,
             )
-            dfs.append(subgroup_df)
-            continue
-
-        sq_mean, sq_sem = sq_data.flatten()
-
-        # rm status quo from final df to relativize
-        if not include_sq:
-            subgroup_df = subgroup_df[~is_sq]
-        means_rel, sems_rel = relativize_func(
-            means_t=subgroup_df["mean"].values,
-            sems_t=subgroup_df["sem"].values,
-            mean_c=sq_mean,
-            sem_c=sq_sem,
-            as_percent=as_percent,
-            bias_correction=bias_correction,
-            control_as_constant=control_as_constant,
-        )
-        dfs.append(subgroup_df.assign(mean=means_rel, sem=sems_rel))
-    df_rel = pd.concat(dfs, axis=0)
+        df_rel["mean"] = means
+        df_rel["sem"] = sems
+    df_rel = df_rel.drop(columns=["_sq_mean", "_sq_sem", "_sq_found"])
     if include_sq:
         # Zero SEM only for metrics that were actually relativized.
         # Non-relativized metrics (excluded via metric_names scoping)
@@ -794,6 +806,9 @@ def relativize_dataframe(
         if metric_names_set is not None and "metric_name" in df_rel.columns:
             sq_mask = sq_mask & df_rel["metric_name"].isin(metric_names_set)
         df_rel.loc[sq_mask, "sem"] = 0.0
+    else:
+        # rm status quo from final df
+        df_rel = df_rel[~is_sq]
     df_rel.reset_index(inplace=True, drop=True)
     # Reorder columns to match expected order (reuses Data class logic)
     # pyrefly: ignore [bad-argument-type]
@@ -902,3 +902,70 @@ class RelativizeDataTest(TestCase):
             ]
             self.assertEqual(raw_arm["mean"].iloc[0], 6.0)
             self.assertEqual(raw_arm["sem"].iloc[0], 1.2)
+
+    def test_relativize_data_per_trial_status_quo(self) -> None:
+        rows = [
+            (0, "status_quo", 2.0),
+            (0, "0_0", 3.0),
+            (1, "status_quo", 4.0),
+            (1, "1_0", 2.0),
+            (2, "2_0", 7.0),
+        ]
+        df = pd.DataFrame(
+            [
+                {
+                    "trial_index": trial_index,
+                    "arm_name": arm_name,
+                    "metric_name": "foobar",
+                    "metric_signature": "foobar",
+                    "mean": mean,
+                    "sem": 0.0,
+                }
+                for trial_index, arm_name, mean in rows
+            ]
+        )
+        result_df = Data(df=df).relativize().df
+
+        # Each trial is relativized against its own status quo, and trials
+        # without a status quo are passed through raw.
+        self.assertEqual(result_df["arm_name"].tolist(), ["0_0", "1_0", "2_0"])
+        self.assertEqual(result_df["mean"].tolist(), [0.5, -0.5, 7.0])
+        self.assertEqual(result_df["sem"].tolist(), [0.0, 0.0, 0.0])
+
+        with self.subTest("conflicting status quo observations"):
+            conflicting_df = pd.concat(
+                [df, df.iloc[[0]].assign(mean=5.0)], ignore_index=True
+            )
+            with self.assertRaisesRegex(ValueError, "multiple distinct"):
+                Data(df=conflicting_df).relativize()
+
+        with self.subTest("conflicting status quo on out-of-scope metric"):
+            other_df = pd.DataFrame(
+                [
+                    {
+                        "trial_index": 0,
+                        "arm_name": arm_name,
+                        "metric_name": "other",
+                        "metric_signature": "other",
+                        "mean": mean,
+                        "sem": 0.0,
+                    }
+                    for arm_name, mean in [
+                        ("status_quo", 1.0),
+                        ("status_quo", 2.0),
+                        ("0_0", 9.0),
+                    ]
+                ]
+            )
+            scoped_df = (
+                Data(df=pd.concat([df, other_df], ignore_index=True))
+                .relativize(metric_names=["foobar"])
+                .df
+            )
+            # The out-of-scope metric is passed through raw, without the status
+            # quo rows, while "foobar" is still relativized.
+            other_rel = scoped_df[scoped_df["metric_name"] == "other"]
+            self.assertEqual(other_rel["arm_name"].tolist(), ["0_0"])
+            self.assertEqual(other_rel["mean"].tolist(), [9.0])
+            foobar_rel = scoped_df[scoped_df["metric_name"] == "foobar"]
+            self.assertEqual(foobar_rel["mean"].tolist(), [0.5, -0.5, 7.0])
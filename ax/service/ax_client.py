@@ -83,6 +83,7 @@ from ax.utils.common.docutils import copy_doc
 from ax.utils.common.executils import retry_on_exception
 from ax.utils.common.logger import _round_floats_for_logging, get_logger
 from ax.utils.common.random import with_rng_seed
+from ax.utils.common.serialization import json_loads
 from pyre_extensions import assert_is_instance, none_throws
 
 
@@ -1461,7 +1462,7 @@ class AxClient(AnalysisBase, BestPointMixin, InstantiationBase):
         residing in a .json file by the given path.
         """
         with open(filepath) as file:
-            serialized = json.loads(file.read())
+            serialized = json_loads(file.read())
             return cls.from_json_snapshot(serialized=serialized, **kwargs)
 
     def to_json_snapshot(
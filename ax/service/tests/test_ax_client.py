@@ -6,11 +6,15 @@
 
 # pyre-strict
 
+import json
 import math
+import re
 import sys
 import time
 import warnings
-from collections.abc import Sequence
+from collections.abc import Callable, Hashable, Sequence
+from copy import deepcopy
+from functools import lru_cache
 from itertools import product
 from math import ceil
 from typing import Any, cast, TYPE_CHECKING
@@ -23,6 +27,7 @@ from ax.adapter.registry import Cont_X_trans, Generators
 from ax.api.configs import ChoiceParameterConfig, RangeParameterConfig
 from ax.core.arm import Arm
 from ax.core.data import Data, MAP_KEY
+from ax.core.experiment import Experiment
 from ax.core.generator_run import GeneratorRun
 from ax.core.metric import Metric
 from ax.core.multi_type_experiment import MultiTypeExperiment
@@ -39,6 +44,7 @@ from ax.core.parameter import (
 from ax.core.parameter_constraint import ParameterConstraint
 from ax.core.runner import RunnerConfig
 from ax.core.trial import Trial
+from ax.core.trial_status import TrialStatus
 from ax.core.types import (
     ComparisonOp,
     TEvaluationOutcome,
@@ -75,7 +81,10 @@ from ax.service.utils.best_point import (
     observed_pareto,
     predicted_pareto,
 )
-from ax.service.utils.instantiation import FixedFeatures
+from ax.service.utils.instantiation import (
+    FixedFeatures,
+    TParameterRepresentation,
+)
 from ax.storage.sqa_store.db import init_test_engine_and_session_factory
 from ax.storage.sqa_store.decoder import Decoder
 from ax.storage.sqa_store.encoder import Encoder
@@ -88,6 +97,7 @@ from ax.utils.measurement.synthetic_functions import Branin
 from ax.utils.testing.core_stubs import (
     DummyEarlyStoppingStrategy,
     get_branin_experiment,
+    get_branin_search_space,
 )
 from ax.utils.testing.mock import mock_botorch_optimize
 from ax.utils.testing.modeling_stubs import get_observation1trans
@@ -101,6 +111,19 @@ if TYPE_CHECKING:
 RANDOM_SEED = 239
 ARM_NAME = "test_arm_name"
 
+# Error messages asserted on by several trial-lifecycle tests.
+_RE_ALREADY_COMPLETED: re.Pattern[str] = re.compile(r".* already been completed")
+_RE_TERMINAL_STATE: re.Pattern[str] = re.compile(r".* in a terminal state.")
+_RE_NO_LONGER_EXPECTS_DATA: re.Pattern[str] = re.compile(r".* no longer expects")
+_RE_NO_TRIALS: re.Pattern[str] = re.compile(r".* there are no trials")
+
+# Branin search space shared by most tests. Pass as `list(_BRANIN_PARAMS)`;
+# the specs themselves must not be mutated.
+_BRANIN_PARAMS: tuple[TParameterRepresentation, ...] = (
+    {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
+    {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
+)
+
 
 def run_trials_using_recommended_parallelism(
     ax_client: AxClient,
@@ -126,6 +149,57 @@ def run_trials_using_recommended_parallelism(
     return remaining_trials
 
 
+def _complete_n_branin_trials(
+    ax_client: AxClient, n: int, support_intermediate_data: bool = False
+) -> dict[int, TParameterization]:
+    """Generate ``n`` trials in as few ``get_next_trials`` calls as the generation
+    strategy allows and complete each of them with its Branin value.
+
+    If ``support_intermediate_data`` is set, the value is attached to the "branin"
+    metric at progression 0; otherwise it is attached to the objective.
+
+    Returns:
+        Mapping from trial indices to parameterizations of the completed trials.
+    """
+    completed = {}
+    while len(completed) < n:
+        trials, _ = ax_client.get_next_trials(max_trials=n - len(completed))
+        if not trials:
+            break
+        for trial_index, parameters in trials.items():
+            value = assert_is_instance(branin(*parameters.values()), float)
+            raw_data: TEvaluationOutcome = (
+                [(0, {"branin": (value, 0.0)})]
+                if support_intermediate_data
+                else (value, 0.0)
+            )
+            ax_client.complete_trial(trial_index=trial_index, raw_data=raw_data)
+        completed.update(trials)
+    return completed
+
+
+def _perturb(parameterization: TParameterization) -> TParameterization:
+    """Shift every (numeric) parameter value by one, yielding a
+    parameterization that does not match any generated trial.
+    """
+    return {k: v + 1.0 for k, v in parameterization.items()}
+
+
+def _get_xy_trial_parameters_array(ax_client: AxClient) -> np.ndarray:
+    """Parameters of all (single-arm) trials on an x/y search space, as an
+    array of shape ``(num_trials, 2)``.
+    """
+    parameterizations = [
+        none_throws(assert_is_instance(t, Trial).arm).parameters
+        for t in ax_client.experiment.trials.values()
+    ]
+    return np.fromiter(
+        (p[name] for p in parameterizations for name in ("x", "y")),
+        dtype=np.float64,
+        count=2 * len(parameterizations),
+    ).reshape(-1, 2)
+
+
 def get_branin_currin(minimize: bool = False) -> BraninCurrin:
     return BraninCurrin(negate=not minimize).to(
         dtype=torch.double,
@@ -192,6 +266,50 @@ def get_branin_currin_optimization_with_N_sobol_trials(
     return ax_client, branin_currin
 
 
+@lru_cache(maxsize=None)
+def _client_snapshot(build: Callable[..., AxClient], *args: Hashable) -> str:
+    """JSON snapshot of the client returned by ``build(*args)``.
+
+    Building a client (creating the experiment and running any trials) is only
+    done once per distinct ``build`` and ``args``; tests then get a fresh client
+    from `_restore`, so no client state is shared between them.
+    """
+    return json.dumps(build(*args).to_json_snapshot())
+
+
+def _restore(snapshot: str) -> AxClient:
+    return AxClient.from_json_snapshot(json.loads(snapshot))
+
+
+def _build_branin_client(
+    bounds_y: tuple[float, float],
+    support_intermediate_data: bool,
+    minimize: bool | None,
+) -> AxClient:
+    ax_client = AxClient()
+    ax_client.create_experiment(
+        parameters=[_BRANIN_PARAMS[0], {**_BRANIN_PARAMS[1], "bounds": list(bounds_y)}],
+        objectives=(
+            None
+            if minimize is None
+            else {"branin": ObjectiveProperties(minimize=minimize)}
+        ),
+        support_intermediate_data=support_intermediate_data,
+    )
+    return ax_client
+
+
+def _build_branin_currin_client_with_N_sobol_trials(
+    num_trials: int, minimize: bool, outcome_constraints: tuple[str, ...]
+) -> AxClient:
+    ax_client, _ = get_branin_currin_optimization_with_N_sobol_trials(
+        num_trials=num_trials,
+        minimize=minimize,
+        outcome_constraints=list(outcome_constraints) or None,
+    )
+    return ax_client
+
+
 def get_branin_optimization(
     generation_strategy: GenerationStrategy | None = None,
     torch_device: torch.device | None = None,
@@ -202,10 +320,7 @@ def get_branin_optimization(
     )
     ax_client.create_experiment(
         name="test_experiment",
-        parameters=[
-            {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-            {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-        ],
+        parameters=list(_BRANIN_PARAMS),
         objectives={"branin": ObjectiveProperties(minimize=True)},
         support_intermediate_data=support_intermediate_data,
     )
@@ -279,6 +394,23 @@ def get_client_with_simple_discrete_moo_problem(
 class TestAxClient(TestCase):
     """Tests service-like API functionality."""
 
+    def _get_branin_client(
+        self,
+        bounds_y: tuple[float, float] = (0.0, 15.0),
+        support_intermediate_data: bool = False,
+        minimize: bool | None = None,
+    ) -> AxClient:
+        """Fresh `AxClient` on the x in [-5, 10], y in ``bounds_y`` search space.
+
+        If ``minimize`` is None, the experiment uses the default objective;
+        otherwise it has a single "branin" objective in the given direction.
+        """
+        return _restore(
+            _client_snapshot(
+                _build_branin_client, bounds_y, support_intermediate_data, minimize
+            )
+        )
+
     def test_deprecation_warning(self) -> None:
         # Should warn for AxClient but not for arbitrary subclasses.
         with self.assertWarnsRegex(
@@ -298,10 +430,7 @@ class TestAxClient(TestCase):
         ax_client = AxClient()
         ax_client.create_experiment(
             name="test",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
             objectives={"branin": ObjectiveProperties(minimize=True)},
         )
         for i in range(6):
@@ -333,10 +462,7 @@ class TestAxClient(TestCase):
         ax_client = AxClient()
         ax_client.create_experiment(
             name="test",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
         )
         self.assertIsNone(ax_client.status_quo)
         status_quo_params: TParameterization = {"x": 1.0, "y": 1.0}
@@ -351,10 +477,7 @@ class TestAxClient(TestCase):
         ax_client = AxClient()
         ax_client.create_experiment(
             name="test",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
             status_quo=status_quo_params,
         )
         self.assertEqual(ax_client.status_quo, status_quo_params)
@@ -368,10 +491,7 @@ class TestAxClient(TestCase):
         ax_client = AxClient()
         ax_client.create_experiment(
             name="test",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
             status_quo={"x": 1.0, "y": 1.0},
         )
         ax_client.set_optimization_config(
@@ -430,10 +550,7 @@ class TestAxClient(TestCase):
         ax_client = AxClient()
         ax_client.create_experiment(
             name="test",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
             status_quo={"x": 1.0, "y": 1.0},
         )
         ax_client.set_optimization_config(
@@ -465,10 +582,7 @@ class TestAxClient(TestCase):
         ax_client = AxClient()
         ax_client.create_experiment(
             name="test",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
             status_quo={"x": 1.0, "y": 1.0},
         )
         original_opt_config = ax_client.experiment.optimization_config
@@ -574,10 +688,7 @@ class TestAxClient(TestCase):
         ax_client = AxClient()
         ax_client.create_experiment(
             name="test",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
             objectives={"branin": ObjectiveProperties(minimize=True)},
         )
         trials, completed = ax_client.get_next_trials(max_trials=3)
@@ -614,10 +725,7 @@ class TestAxClient(TestCase):
         )
         ax_client.create_experiment(
             name="unique_test_experiment",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
         )
         second_client = AxClient(db_settings=db_settings)
         second_client.load_experiment_from_database("unique_test_experiment")
@@ -664,10 +772,7 @@ class TestAxClient(TestCase):
         ):
             ax_client.create_experiment(
                 name="unique_test_experiment1",
-                parameters=[
-                    {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                    {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-                ],
+                parameters=list(_BRANIN_PARAMS),
             )
 
     @mock_botorch_optimize
@@ -675,10 +780,7 @@ class TestAxClient(TestCase):
         """Test that Sobol+MOO is used if no GenerationStrategy is provided."""
         ax_client = AxClient()
         ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
             objectives={
                 "branin": ObjectiveProperties(minimize=True, threshold=1.0),
                 "b": ObjectiveProperties(minimize=True, threshold=1.0),
@@ -2127,18 +2229,8 @@ class TestAxClient(TestCase):
 
     @mock_botorch_optimize
     def test_raw_data_format(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-        )
-        trial_index = 0
-        for _ in range(6):
-            parameterization, trial_index = ax_client.get_next_trial()
-            x, y = parameterization.get("x"), parameterization.get("y")
-            ax_client.complete_trial(trial_index, raw_data=(float(branin(x, y)), 0.0))
+        ax_client = self._get_branin_client()
+        trial_index = max(_complete_n_branin_trials(ax_client, n=6))
         with self.assertRaisesRegex(
             UserInputError, "Raw data does not conform to the expected structure."
         ):
@@ -2150,13 +2242,8 @@ class TestAxClient(TestCase):
 
     @mock_botorch_optimize
     def test_raw_data_format_with_map_results(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 1.0]},
-            ],
-            support_intermediate_data=True,
+        ax_client = self._get_branin_client(
+            bounds_y=(0.0, 1.0), support_intermediate_data=True
         )
 
         for _ in range(6):
@@ -2189,10 +2276,7 @@ class TestAxClient(TestCase):
         # generating.
         ax_client = AxClient(enforce_sequential_optimization=False)
         ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
         )
         # Check that enforce_num_trials is False by verifying no
         # MaxTrialsAwaitingData exists in pausing_criteria
@@ -2216,14 +2300,8 @@ class TestAxClient(TestCase):
             ax_client.get_next_trial()
 
     def test_update_running_trial_with_intermediate_data(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 1.0]},
-            ],
-            objectives={"branin": ObjectiveProperties(minimize=True)},
-            support_intermediate_data=True,
+        ax_client = self._get_branin_client(
+            bounds_y=(0.0, 1.0), support_intermediate_data=True, minimize=True
         )
         parameterization, trial_index = ax_client.get_next_trial()
         # Launch Trial and update it 3 times with additional data.
@@ -2242,14 +2320,8 @@ class TestAxClient(TestCase):
             lookup_data = ax_client.experiment.lookup_data().full_df
             self.assertEqual(len(lookup_data), t + 1)
 
-        no_intermediate_data_ax_client = AxClient()
-        no_intermediate_data_ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 1.0]},
-            ],
-            support_intermediate_data=False,
-            objectives={"branin": ObjectiveProperties(minimize=True)},
+        no_intermediate_data_ax_client = self._get_branin_client(
+            bounds_y=(0.0, 1.0), support_intermediate_data=False, minimize=True
         )
         parameterization, trial_index = no_intermediate_data_ax_client.get_next_trial()
         x, y = parameterization.get("x"), parameterization.get("y")
@@ -2311,14 +2383,14 @@ class TestAxClient(TestCase):
         _, idx = ax_client.get_next_trial()
         ax_client.complete_trial(trial_index=idx, raw_data=[(0, {"branin": (0, 0.0)})])
         # Cannot complete a trial twice, should use `update_trial_data`.
-        with self.assertRaisesRegex(UnsupportedError, ".* already been completed"):
+        with self.assertRaisesRegex(UnsupportedError, _RE_ALREADY_COMPLETED):
             ax_client.complete_trial(
                 trial_index=idx, raw_data=[(0, {"branin": (0, 0.0)})]
             )
 
         # With early stopped trial.
         params, idx = ax_client.get_next_trial()
-        value = assert_is_instance(branin(*params.values()), float)
+        value = assert_is_instance(branin(params["x"], params["y"]), float)
         ax_client.update_running_trial_with_intermediate_data(
             idx, raw_data=[(0, {"branin": (value, 0.0)})]
         )
@@ -2345,14 +2417,8 @@ class TestAxClient(TestCase):
         self.assertTrue(ax_client.get_trial(idx).status.is_failed)
 
     def test_incomplete_multi_fidelity_trial(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 1.0]},
-            ],
-            objectives={"branin": ObjectiveProperties(minimize=True)},
-            support_intermediate_data=True,
+        ax_client = self._get_branin_client(
+            bounds_y=(0.0, 1.0), support_intermediate_data=True, minimize=True
         )
         # Trial with complete data
         params, idx = ax_client.get_next_trial()
@@ -2376,22 +2442,16 @@ class TestAxClient(TestCase):
         _, idx = ax_client.get_next_trial()
         ax_client.abandon_trial(trial_index=idx)
         data = ax_client.experiment.fetch_data()
-        self.assertEqual(len(data.df.index), 0)
+        self.assertTrue(data.df.empty)
 
         # Can't update a completed trial.
         _, idx2 = ax_client.get_next_trial()
         ax_client.complete_trial(trial_index=idx2, raw_data={"branin": (0, 0.0)})
-        with self.assertRaisesRegex(ValueError, ".* in a terminal state."):
+        with self.assertRaisesRegex(ValueError, _RE_TERMINAL_STATE):
             ax_client.abandon_trial(trial_index=idx2)
 
     def test_ttl_trial(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-        )
+        ax_client = self._get_branin_client()
 
         # A ttl trial that ends adds no data.
         params, idx = ax_client.get_next_trial(ttl_seconds=1)
@@ -2402,13 +2462,7 @@ class TestAxClient(TestCase):
         self.assertEqual(none_throws(ax_client.get_best_parameters())[0], params)
 
     def test_fail_on_batch(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-        )
+        ax_client = self._get_branin_client()
         batch_trial = ax_client.experiment.new_batch_trial(
             generator_run=GeneratorRun(
                 arms=[
@@ -2425,31 +2479,17 @@ class TestAxClient(TestCase):
             ax_client.complete_trial(batch_trial.index, 0)
 
     def test_log_failure(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-        )
+        ax_client = self._get_branin_client()
         _, idx = ax_client.get_next_trial()
         ax_client.log_trial_failure(idx, metadata={"dummy": "test"})
-        self.assertTrue(ax_client.experiment.trials[idx].status.is_failed)
-        self.assertEqual(
-            ax_client.experiment.trials[idx].run_metadata.get("dummy"),
-            "test",
-        )
-        with self.assertRaisesRegex(UnsupportedError, ".* no longer expects"):
+        trial = ax_client.experiment.trials[idx]
+        self.assertTrue(trial.status.is_failed)
+        self.assertEqual(trial.run_metadata.get("dummy"), "test")
+        with self.assertRaisesRegex(UnsupportedError, _RE_NO_LONGER_EXPECTS_DATA):
             ax_client.complete_trial(idx, {})
 
     def test_attach_trial_and_get_trial_parameters(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-        )
+        ax_client = self._get_branin_client()
         params, idx = ax_client.attach_trial(
             parameters={"x": 0.0, "y": 1.0}, arm_name=ARM_NAME
         )
@@ -2469,13 +2509,7 @@ class TestAxClient(TestCase):
             ax_client.attach_trial({"x": 1, "y": 2})
 
     def test_attach_trial_ttl_seconds(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-        )
+        ax_client = self._get_branin_client()
         params, idx = ax_client.attach_trial(
             parameters={"x": 0.0, "y": 1.0}, ttl_seconds=1
         )
@@ -2489,13 +2523,7 @@ class TestAxClient(TestCase):
         )
 
     def test_attach_trial_numpy(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-        )
+        ax_client = self._get_branin_client()
         params, idx = ax_client.attach_trial(parameters={"x": 0.0, "y": 1.0})
         ax_client.complete_trial(trial_index=idx, raw_data=np.int32(5))
         self.assertEqual(none_throws(ax_client.get_best_parameters())[0], params)
@@ -2506,10 +2534,7 @@ class TestAxClient(TestCase):
         with self.assertRaises(ValueError):
             ax_client.create_experiment(
                 name="test_experiment",
-                parameters=[
-                    {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                    {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-                ],
+                parameters=list(_BRANIN_PARAMS),
                 objectives={"test_objective": ObjectiveProperties(minimize=True)},
                 outcome_constraints=["some_metric <= 4.0%"],
             )
@@ -2520,10 +2545,7 @@ class TestAxClient(TestCase):
         with self.assertRaisesRegex(AssertionError, "No generation strategy"):
             ax_client.get_max_concurrency()
         ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
         )
         self.assertEqual(ax_client.get_max_concurrency(), [(5, 5), (-1, 3)])
         self.assertEqual(
@@ -2534,13 +2556,7 @@ class TestAxClient(TestCase):
         )
         # With incorrect parallelism setting, the 'need more data' error should
         # still be raised.
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-        )
+        ax_client = self._get_branin_client()
         with self.assertRaisesRegex(DataRequiredError, "All trials for current node"):
             run_trials_using_recommended_parallelism(ax_client, [(6, 6), (-1, 3)], 20)
 
@@ -2572,20 +2588,14 @@ class TestAxClient(TestCase):
                 {"name": "x3", "type": "fixed", "value": 2, "value_type": "int"}
             ]
         )
-        with self.assertRaisesRegex(ValueError, ".* there are no trials"):
+        with self.assertRaisesRegex(ValueError, _RE_NO_TRIALS):
             ax_client.get_contour_plot()
-        with self.assertRaisesRegex(ValueError, ".* there are no trials"):
+        with self.assertRaisesRegex(ValueError, _RE_NO_TRIALS):
             ax_client.get_feature_importances()
         ax_client.get_next_trial()
         with self.assertRaisesRegex(ValueError, ".* less than 2 parameters"):
             ax_client.get_contour_plot()
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ]
-        )
+        ax_client = self._get_branin_client()
         ax_client.get_next_trial()
         with self.assertRaisesRegex(ValueError, "If `param_x` is provided"):
             ax_client.get_contour_plot(param_x="y")
@@ -2615,20 +2625,14 @@ class TestAxClient(TestCase):
         ax_client = AxClient(db_settings=db_settings)
         ax_client.create_experiment(
             name="test_experiment",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
             support_intermediate_data=True,
         )
         ax_client.add_tracking_metrics(metric_names=["branin"])
-        for _ in range(5):
-            parameters, trial_index = ax_client.get_next_trial()
-            value = assert_is_instance(branin(*parameters.values()), float)
-            ax_client.complete_trial(
-                trial_index=trial_index,
-                raw_data=[(0, {"branin": (value, 0.0)})],
-            )
+        trials = _complete_n_branin_trials(
+            ax_client, n=5, support_intermediate_data=True
+        )
+        self.assertEqual(len(trials), 5)
         gs = ax_client.generation_strategy
         ax_client = AxClient(db_settings=db_settings)
         ax_client.load_experiment_from_database("test_experiment")
@@ -2642,10 +2646,7 @@ class TestAxClient(TestCase):
             # Overwriting existing experiment.
             ax_client.create_experiment(
                 name="test_experiment",
-                parameters=[
-                    {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                    {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-                ],
+                parameters=list(_BRANIN_PARAMS),
             )
         with self.assertRaises(ValueError):
             # Overwriting existing experiment with overwrite flag with present
@@ -2661,7 +2662,7 @@ class TestAxClient(TestCase):
 
         # Attach an early stopped trial.
         parameters, trial_index = ax_client.get_next_trial()
-        value = assert_is_instance(branin(*parameters.values()), float)
+        value = assert_is_instance(branin(parameters["x"], parameters["y"]), float)
         ax_client.add_tracking_metrics(metric_names=["branin"])
         ax_client.update_running_trial_with_intermediate_data(
             trial_index=trial_index, raw_data=[(0, {"branin": (value, 0.0)})]
@@ -2681,27 +2682,17 @@ class TestAxClient(TestCase):
         ax_client = AxClient()
         ax_client.create_experiment(
             name="test_experiment",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
         )
 
         # Log a trial
-        parameters, trial_index = ax_client.get_next_trial()
-        ax_client.complete_trial(
-            trial_index=trial_index,
-            raw_data=float(branin(*parameters.values())),
-        )
+        _complete_n_branin_trials(ax_client, n=1)
 
         with self.assertRaises(ValueError):
             # Overwriting existing experiment.
             ax_client.create_experiment(
                 name="test_experiment",
-                parameters=[
-                    {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                    {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-                ],
+                parameters=list(_BRANIN_PARAMS),
             )
         # Overwriting existing experiment with overwrite flag.
         ax_client.create_experiment(
@@ -2716,68 +2707,49 @@ class TestAxClient(TestCase):
         self.assertEqual(len(ax_client.experiment.trials), 0)
 
         # Log a trial
-        parameters, trial_index = ax_client.get_next_trial()
+        (parameters,) = _complete_n_branin_trials(ax_client, n=1).values()
         self.assertIn("x1", parameters.keys())
         self.assertIn("x2", parameters.keys())
-        ax_client.complete_trial(
-            trial_index=trial_index,
-            raw_data=float(branin(*parameters.values())),
-        )
 
     def test_fixed_random_seed_reproducibility(self) -> None:
-        ax_client = AxClient(random_seed=RANDOM_SEED)
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ]
-        )
-        for _ in range(5):
-            params, idx = ax_client.get_next_trial()
-            ax_client.complete_trial(
-                idx, float(branin(params.get("x"), params.get("y")))
-            )
-        trial_parameters_1 = [
-            none_throws(assert_is_instance(t, Trial).arm).parameters
-            for t in ax_client.experiment.trials.values()
-        ]
-        ax_client = AxClient(random_seed=RANDOM_SEED)
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ]
+        def _generate_5(seed: int) -> np.ndarray:
+            ax_client = AxClient(random_seed=seed)
+            ax_client.create_experiment(parameters=list(_BRANIN_PARAMS))
+            _complete_n_branin_trials(ax_client, n=5)
+            return _get_xy_trial_parameters_array(ax_client)
+
+        # The two runs are kept sequential: `AxClient` seeds the global numpy
+        # and torch RNGs around generation (`with_rng_seed`), so running them
+        # concurrently would make them interfere with each other.
+        self.assertTrue(
+            np.array_equal(_generate_5(RANDOM_SEED), _generate_5(RANDOM_SEED))
         )
-        for _ in range(5):
-            params, idx = ax_client.get_next_trial()
-            ax_client.complete_trial(
-                idx, float(branin(params.get("x"), params.get("y")))
-            )
-        trial_parameters_2 = [
-            none_throws(assert_is_instance(t, Trial).arm).parameters
-            for t in ax_client.experiment.trials.values()
-        ]
-        self.assertEqual(trial_parameters_1, trial_parameters_2)
 
     def test_init_position_saved(self) -> None:
         ax_client = AxClient(random_seed=RANDOM_SEED)
         ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
             name="sobol_init_position_test",
         )
-        for _ in range(4):
+        num_trials = 4
+        for i in range(num_trials):
             # For each generated trial, snapshot the client before generating it,
             # then recreate client, regenerate the trial and compare the trial
             # generated before and after snapshotting. If the state of Sobol is
             # recorded correctly, the newly generated trial will be the same as
-            # the one generated before the snapshotting.
-            serialized = ax_client.to_json_snapshot()
-            params, idx = ax_client.get_next_trial()
-            ax_client = AxClient.from_json_snapshot(serialized)
-            with self.subTest(ax=ax_client, params=params, idx=idx):
+            # the one generated before the snapshotting. Intermediate snapshots
+            # are in-memory copies; the last one goes through JSON to check that
+            # Sobol state is restored from what was saved on the generator runs.
+            use_json = i == num_trials - 1
+            if use_json:
+                serialized = ax_client.to_json_snapshot()
+                params, idx = ax_client.get_next_trial()
+                ax_client = AxClient.from_json_snapshot(serialized)
+            else:
+                ax_client_copy = deepcopy(ax_client)
+                params, idx = ax_client.get_next_trial()
+                ax_client = ax_client_copy
+            with self.subTest(ax=ax_client, params=params, idx=idx, use_json=use_json):
                 new_params, new_idx = ax_client.get_next_trial()
                 # Sobol "init_position" setting should be saved on the generator run.
                 trial = assert_is_instance(ax_client.experiment.trials[idx], Trial)
@@ -2795,12 +2767,7 @@ class TestAxClient(TestCase):
 
     def test_unnamed_experiment_snapshot(self) -> None:
         ax_client = AxClient(random_seed=RANDOM_SEED)
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ]
-        )
+        ax_client.create_experiment(parameters=list(_BRANIN_PARAMS))
         serialized = ax_client.to_json_snapshot()
         ax_client = AxClient.from_json_snapshot(serialized)
         self.assertIsNone(ax_client.experiment._name)
@@ -2811,15 +2778,13 @@ class TestAxClient(TestCase):
         return_value=[get_observation1trans(first_metric_signature="branin").data],
     )
     def test_get_model_predictions(self, _predict: Mock) -> None:
-        ax_client = get_branin_optimization()
+        ax_client = self._get_branin_client(minimize=True)
         ax_client.get_next_trial()
         ax_client.complete_trial(0, {"branin": (5.0, 0.5)})
         self.assertEqual(ax_client.get_model_predictions(), {0: {"branin": (9.0, 1.0)}})
 
     def test_get_model_predictions_no_next_trial_all_trials(self) -> None:
-        ax_client = _set_up_client_for_get_model_predictions_no_next_trial()
-        _attach_completed_trials(ax_client)
-        _attach_not_completed_trials(ax_client)
+        ax_client = _set_up_client_for_get_model_predictions_with_trials()
 
         all_predictions_dict = ax_client.get_model_predictions()
         # Expect all 4 trial predictions (2 completed + 2 not completed)
@@ -2859,9 +2824,7 @@ class TestAxClient(TestCase):
             ax_client.fit_model()
 
     def test_get_model_predictions_no_next_trial_filtered(self) -> None:
-        ax_client = _set_up_client_for_get_model_predictions_no_next_trial()
-        _attach_completed_trials(ax_client)
-        _attach_not_completed_trials(ax_client)
+        ax_client = _set_up_client_for_get_model_predictions_with_trials()
 
         all_predictions_dict = ax_client.get_model_predictions(
             metric_names=["test_metric1"]
@@ -2870,9 +2833,7 @@ class TestAxClient(TestCase):
         self.assertEqual(len(all_predictions_dict[0]), 1)
 
     def test_get_model_predictions_no_next_trial_in_sample(self) -> None:
-        ax_client = _set_up_client_for_get_model_predictions_no_next_trial()
-        _attach_completed_trials(ax_client)
-        _attach_not_completed_trials(ax_client)
+        ax_client = _set_up_client_for_get_model_predictions_with_trials()
 
         in_sample_predictions_dict = ax_client.get_model_predictions(
             include_out_of_sample=False
@@ -2924,15 +2885,7 @@ class TestAxClient(TestCase):
             ax_client.get_max_parallelism()
 
     def test_find_last_trial_with_parameterization(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            name="test_experiment",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-            objectives={"branin": ObjectiveProperties(minimize=True)},
-        )
+        ax_client = self._get_branin_client(minimize=True)
         params, trial_idx = ax_client.get_next_trial()
         found_trial_idx = ax_client._find_last_trial_with_parameterization(
             parameterization=params
@@ -2946,19 +2899,11 @@ class TestAxClient(TestCase):
         self.assertEqual(found_trial_idx, new_trial_idx)
         with self.assertRaisesRegex(ValueError, "No .* matches"):
             found_trial_idx = ax_client._find_last_trial_with_parameterization(
-                parameterization={k: v + 1.0 for k, v in params.items()}
+                parameterization=_perturb(params)
             )
 
     def test_verify_parameterization(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            name="test_experiment",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-            objectives={"branin": ObjectiveProperties(minimize=True)},
-        )
+        ax_client = self._get_branin_client(minimize=True)
         params, trial_idx = ax_client.get_next_trial()
         self.assertTrue(
             ax_client.verify_trial_parameterization(
@@ -2969,13 +2914,13 @@ class TestAxClient(TestCase):
         self.assertTrue(
             ax_client.verify_trial_parameterization(
                 trial_index=trial_idx,
-                parameterization={k: params[k] for k in reversed(list(params.keys()))},
+                parameterization=dict(reversed(params.items())),
             )
         )
         self.assertFalse(
             ax_client.verify_trial_parameterization(
                 trial_index=trial_idx,
-                parameterization={k: v + 1.0 for k, v in params.items()},
+                parameterization=_perturb(params),
             )
         )
 
@@ -2984,15 +2929,7 @@ class TestAxClient(TestCase):
         side_effect=RuntimeError("cholesky_cpu error - bad matrix"),
     )
     def test_annotate_exception(self, _: Mock) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            name="test_experiment",
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-            objectives={"branin": ObjectiveProperties(minimize=True)},
-        )
+        ax_client = self._get_branin_client(minimize=True)
         with self.assertRaisesRegex(
             expected_exception=RuntimeError,
             expected_regex="Cholesky errors typically occur",
@@ -3055,7 +2992,7 @@ class TestAxClient(TestCase):
             predicted_pareto = ax_client.get_pareto_optimal_parameters()
         # Since we're just using actual values as predicted, the solution should
         # be the same as in the observed case.
-        self.assertEqual(sorted(predicted_pareto.keys()), [solution])
+        self.assertEqual(set(predicted_pareto.keys()), {solution})
         observed_pareto = ax_client.get_pareto_optimal_parameters(
             use_model_predictions=False
         )
@@ -3075,7 +3012,7 @@ class TestAxClient(TestCase):
             if outcome_constraints is not None:
                 self.assertEqual(branin + currin, obs[1][0]["c"])
 
-        self.assertEqual(sorted(observed_pareto.keys()), [solution])
+        self.assertEqual(set(observed_pareto.keys()), {solution})
         # Check that we did not specify objective threshold overrides (because we
         # did not have to infer them)
         self.assertIsNone(mock_observed_pareto.call_args[1].get("objective_thresholds"))
@@ -3090,8 +3027,13 @@ class TestAxClient(TestCase):
     def helper_test_get_pareto_optimal_points_from_sobol_step(
         self, minimize: bool, outcome_constraints: list[str] | None = None
     ) -> None:
-        ax_client, _ = get_branin_currin_optimization_with_N_sobol_trials(
-            num_trials=20, minimize=minimize, outcome_constraints=outcome_constraints
+        ax_client = _restore(
+            _client_snapshot(
+                _build_branin_currin_client_with_N_sobol_trials,
+                20,
+                minimize,
+                tuple(outcome_constraints or ()),
+            )
         )
         gs = ax_client.generation_strategy
         self.assertEqual(
@@ -3127,18 +3069,23 @@ class TestAxClient(TestCase):
         frontier_means = [elt[1][0] for elt in predicted_pareto.values()]
         frontier_means_arr = np.array(
             [[elt["branin"], elt["currin"]] for elt in frontier_means]
-        )
+        ).reshape(-1, 2)
 
-        for point in frontier_means_arr:
-            improvement = (
-                point - frontier_means_arr if minimize else frontier_means_arr - point
-            )
-            has_dominating_points = (improvement > 0).all(1).any()
-            self.assertFalse(has_dominating_points)
-            within_threshold = (
-                (point < thresholds) if minimize else (point > thresholds)
-            )
-            self.assertTrue(within_threshold.all())
+        # improvement[i, j] is the improvement of frontier point j over point i;
+        # no point may be strictly improved upon in all objectives by another.
+        improvement = (
+            frontier_means_arr[:, None, :] - frontier_means_arr[None, :, :]
+            if minimize
+            else frontier_means_arr[None, :, :] - frontier_means_arr[:, None, :]
+        )
+        has_dominating_points = (improvement > 0).all(axis=-1).any(axis=1)
+        self.assertFalse(has_dominating_points.any())
+        within_threshold = (
+            (frontier_means_arr < thresholds)
+            if minimize
+            else (frontier_means_arr > thresholds)
+        )
+        self.assertTrue(within_threshold.all())
 
         observed_pareto = ax_client.get_pareto_optimal_parameters(
             use_model_predictions=False
@@ -3149,14 +3096,18 @@ class TestAxClient(TestCase):
 
         # Check that the data in the frontier matches the observed data
         # (it should be in the original, un-transformed space)
-        input_data = (
-            ax_client.experiment.fetch_data([idx_of_frontier_point]).df["mean"].values
+        input_data = np.asarray(
+            ax_client.experiment.fetch_data([idx_of_frontier_point]).df["mean"],
+            dtype=np.float64,
         )
         pareto_y = observed_pareto[idx_of_frontier_point][1][0]
-        pareto_y_list = [pareto_y["branin"], pareto_y["currin"]]
-        if "c" in pareto_y.keys():
-            pareto_y_list.append(pareto_y["c"])
-        self.assertTrue((input_data == pareto_y_list).all())
+        metric_names = ("branin", "currin") + (("c",) if "c" in pareto_y else ())
+        pareto_y_arr = np.fromiter(
+            (pareto_y[m] for m in metric_names),
+            dtype=np.float64,
+            count=len(metric_names),
+        )
+        self.assertTrue(np.array_equal(input_data, pareto_y_arr))
 
     # Part 1/3 of tests run by helper_test_get_pareto_optimal_points_from_sobol_step
     @mock_botorch_optimize
@@ -3234,11 +3185,14 @@ class TestAxClient(TestCase):
         for use_y0_threshold, use_y2_constraint in product(
             [False, True], [False, True]
         ):
-            self.helper_test_get_pareto_optimal_parameters_simple(
-                minimize=minimize,
-                use_y0_threshold=use_y0_threshold,
-                use_y2_constraint=use_y2_constraint,
-            )
+            with self.subTest(
+                use_y0_threshold=use_y0_threshold, use_y2_constraint=use_y2_constraint
+            ):
+                self.helper_test_get_pareto_optimal_parameters_simple(
+                    minimize=minimize,
+                    use_y0_threshold=use_y0_threshold,
+                    use_y2_constraint=use_y2_constraint,
+                )
 
     # Part 2/2 of tests run by helper_test_get_pareto_optimal_parameters_simple
     @mock_botorch_optimize
@@ -3247,11 +3201,14 @@ class TestAxClient(TestCase):
         for use_y0_threshold, use_y2_constraint in product(
             [False, True], [False, True]
         ):
-            self.helper_test_get_pareto_optimal_parameters_simple(
-                minimize=minimize,
-                use_y0_threshold=use_y0_threshold,
-                use_y2_constraint=use_y2_constraint,
-            )
+            with self.subTest(
+                use_y0_threshold=use_y0_threshold, use_y2_constraint=use_y2_constraint
+            ):
+                self.helper_test_get_pareto_optimal_parameters_simple(
+                    minimize=minimize,
+                    use_y0_threshold=use_y0_threshold,
+                    use_y2_constraint=use_y2_constraint,
+                )
 
     def helper_test_get_pareto_optimal_parameters_simple(
         self, minimize: bool, use_y0_threshold: bool, use_y2_constraint: bool
@@ -3432,25 +3389,15 @@ class TestAxClient(TestCase):
             early_stopping_strategy=DummyEarlyStoppingStrategy(expected)
         )
         ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
             support_intermediate_data=True,
         )
         actual = ax_client.should_stop_trials_early(trial_indices={1, 2, 3})
         self.assertEqual(actual, expected)
 
     def test_stop_trial_early(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-            support_intermediate_data=True,
-        )
-        parameters, idx = ax_client.get_next_trial()
+        ax_client = self._get_branin_client(support_intermediate_data=True)
+        parameters, idx = ax_client.attach_trial(parameters={"x": 0.0, "y": 5.0})
         value = assert_is_instance(branin(*parameters.values()), float)
         ax_client.add_tracking_metrics(metric_names=["branin"])
         ax_client.update_running_trial_with_intermediate_data(
@@ -3461,28 +3408,14 @@ class TestAxClient(TestCase):
         self.assertTrue(trial.status.is_early_stopped)
 
     def test_estimate_early_stopping_savings(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-            support_intermediate_data=True,
-        )
-        _, idx = ax_client.get_next_trial()
-        ax_client.experiment.trials[idx].mark_early_stopped(unsafe=True)
+        ax_client = self._get_branin_client(support_intermediate_data=True)
+        _, idx = ax_client.attach_trial(parameters={"x": 0.0, "y": 5.0})
+        ax_client.experiment.trials[idx]._status = TrialStatus.EARLY_STOPPED
 
         self.assertEqual(ax_client.estimate_early_stopping_savings(), 0)
 
     def test_max_concurrency_exception_when_early_stopping(self) -> None:
-        ax_client = AxClient()
-        ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
-            support_intermediate_data=True,
-        )
+        ax_client = self._get_branin_client(support_intermediate_data=True)
 
         exception: MaxParallelismReachedException = MaxParallelismReachedException(
             step_index=1, num_running=10
@@ -3510,10 +3443,7 @@ class TestAxClient(TestCase):
         ax_client = AxClient(early_stopping_strategy=DummyEarlyStoppingStrategy())
         with self.assertRaisesRegex(ValueError, ".*`support_intermediate_data=True`.*"):
             ax_client.create_experiment(
-                parameters=[
-                    {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                    {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-                ],
+                parameters=list(_BRANIN_PARAMS),
                 support_intermediate_data=False,
             )
 
@@ -3535,14 +3465,12 @@ class TestAxClient(TestCase):
     def test_repr_function(
         self,
     ) -> None:
+        # Only the string contract is checked here, so attach a bare experiment
+        # instead of going through `create_experiment`.
         ax_client = AxClient()
         experiment_name = "test_experiment"
-        ax_client.create_experiment(
-            name=experiment_name,
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+        ax_client._experiment = Experiment(
+            name=experiment_name, search_space=get_branin_search_space()
         )
         self.assertEqual(
             ax_client.__repr__(), f"AxClient(experiment=Experiment({experiment_name}))"
@@ -3551,10 +3479,7 @@ class TestAxClient(TestCase):
     def test_gen_fixed_features(self) -> None:
         ax_client = AxClient(random_seed=RANDOM_SEED)
         ax_client.create_experiment(
-            parameters=[
-                {"name": "x", "type": "range", "bounds": [-5.0, 10.0]},
-                {"name": "y", "type": "range", "bounds": [0.0, 15.0]},
-            ],
+            parameters=list(_BRANIN_PARAMS),
             name="fixed_features",
         )
         with mock.patch.object(
@@ -3644,8 +3569,19 @@ class TestAxClient(TestCase):
 # get_next_trial. Create Ax Client with an experiment where
 # num_initial_trials kwarg is zero. Note that this kwarg is
 # needed to be able to instantiate the model for the first time
-# without calling get_next_trial().
+# without calling get_next_trial(). The experiment is only created once; each
+# call returns a fresh client restored from its JSON snapshot.
 def _set_up_client_for_get_model_predictions_no_next_trial() -> AxClient:
+    return _restore(_client_snapshot(_build_model_predictions_client))
+
+
+# Same as `_set_up_client_for_get_model_predictions_no_next_trial`, with both
+# completed and not-yet-completed trials attached.
+def _set_up_client_for_get_model_predictions_with_trials() -> AxClient:
+    return _restore(_client_snapshot(_build_model_predictions_client_with_trials))
+
+
+def _build_model_predictions_client() -> AxClient:
     ax_client = AxClient()
     ax_client.create_experiment(
         name="test_experiment",
@@ -3665,7 +3601,13 @@ def _set_up_client_for_get_model_predictions_no_next_trial() -> AxClient:
         objectives={"test_metric1": ObjectiveProperties(minimize=False)},
         outcome_constraints=["test_metric2 <= 1.5"],
     )
+    return ax_client
+
 
+def _build_model_predictions_client_with_trials() -> AxClient:
+    ax_client = _set_up_client_for_get_model_predictions_no_next_trial()
+    _attach_completed_trials(ax_client)
+    _attach_not_completed_trials(ax_client)
     return ax_client
 
 
@@ -3697,5 +3639,6 @@ def _attach_not_completed_trials(ax_client: AxClient) -> None:
 def _evaluate_test_metrics(
     parameters: TParameterization,
 ) -> dict[str, tuple[float, float]]:
-    x = np.array([parameters.get(f"x{i + 1}") for i in range(2)])
-    return {"test_metric1": (x[0] / x[1], 0.0), "test_metric2": (x[0] + x[1], 0.0)}
+    x1 = assert_is_instance(parameters["x1"], float)
+    x2 = assert_is_instance(parameters["x2"], float)
+    return {"test_metric1": (x1 / x2, 0.0), "test_metric2": (x1 + x2, 0.0)}
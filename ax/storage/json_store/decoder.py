@@ -69,6 +69,7 @@ from ax.storage.utils import data_by_trial_to_data
 from ax.utils.common.logger import get_logger
 from ax.utils.common.serialization import (
     extract_init_args,
+    json_loads,
     SerializationMixin,
     TClassDecoderRegistry,
     TDecoderRegistry,
@@ -163,17 +164,20 @@ def object_from_json(
 ) -> Any:
     """Recursively load objects from a JSON-serializable dictionary."""
 
+    # Leaves (and empty columns, which decode to `None`) are returned as is;
+    # check them before setting up the registry kwargs used for recursion.
+    if type(object_json) in (str, int, float, bool, type(None)) or isinstance(
+        object_json, Enum
+    ):
+        return object_json
+
     registry_kwargs = RegistryKwargs(
         decoder_registry=decoder_registry, class_decoder_registry=class_decoder_registry
     )
 
     _object_from_json = partial(object_from_json, **vars(registry_kwargs))
 
-    if type(object_json) in (str, int, float, bool, type(None)) or isinstance(
-        object_json, Enum
-    ):
-        return object_json
-    elif isinstance(object_json, list):
+    if isinstance(object_json, list):
         return [_object_from_json(i) for i in object_json]
     elif isinstance(object_json, tuple):
         return tuple(_object_from_json(i) for i in object_json)
@@ -334,7 +338,7 @@ def object_from_json(
             # Special handling for Data backward compatibility
             if _class is Data:
                 data_json_str = object_json.get("df", {}).get("value", "")
-                data_json = json.loads(data_json_str)
+                data_json = json_loads(data_json_str)
                 if data_json and "metric_signature" not in data_json:
                     object_json["df"]["value"] = (
                         _update_data_json_with_metric_signature(
@@ -1559,6 +1563,6 @@ def _update_deprecated_model_registry(name: str) -> str:
 
 
 def _update_data_json_with_metric_signature(data_json_str: str) -> str:
-    data_json = json.loads(data_json_str)
+    data_json = json_loads(data_json_str)
     data_json["metric_signature"] = data_json.get("metric_name", {})
     return json.dumps(data_json)
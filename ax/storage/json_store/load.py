@@ -6,7 +6,6 @@
 
 # pyre-strict
 
-import json
 from collections.abc import Callable
 from typing import Any
 
@@ -16,7 +15,7 @@ from ax.storage.json_store.registry import (
     CORE_CLASS_DECODER_REGISTRY,
     CORE_DECODER_REGISTRY,
 )
-from ax.utils.common.serialization import TDecoderRegistry
+from ax.utils.common.serialization import json_loads, TDecoderRegistry
 
 
 def load_experiment(
@@ -32,7 +31,7 @@ def load_experiment(
     2) Convert dictionary to Ax experiment instance.
     """
     with open(filepath) as file:
-        json_experiment = json.loads(file.read())
+        json_experiment = json_loads(file.read())
         return object_from_json(
             json_experiment, decoder_registry, class_decoder_registry
         )
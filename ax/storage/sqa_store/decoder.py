@@ -14,6 +14,7 @@ from copy import deepcopy
 from enum import Enum
 from io import StringIO
 from logging import Logger
+from operator import attrgetter
 from typing import Any, cast, Union
 
 import pandas as pd
@@ -99,6 +100,24 @@ from sqlalchemy.orm.exc import DetachedInstanceError
 
 logger: Logger = get_logger(__name__)
 
+# Statuses that are no longer assigned to trials, mapped to the status to load
+# them as. `DISPATCHED` is deprecated and nearly equivalent to `RUNNING`.
+_DEPRECATED_TRIAL_STATUS_REPLACEMENTS: dict[TrialStatus, TrialStatus] = {
+    TrialStatus.DISPATCHED: TrialStatus.RUNNING,
+}
+
+# Leaf ``AnalysisCard`` subclass to decode into, keyed by the ``blob_annotation``
+# written by the encoder. Unknown annotations (e.g. "dataframe") decode into a
+# plain ``AnalysisCard``.
+_ANALYSIS_CARD_CLASS_BY_BLOB_ANNOTATION: dict[str | None, type[AnalysisCard]] = {
+    "not_applicable_state": NotApplicableStateAnalysisCard,
+    "error": ErrorAnalysisCard,
+    "plotly": PlotlyAnalysisCard,
+    "markdown": MarkdownAnalysisCard,
+    "healthcheck": HealthcheckAnalysisCard,
+    "graphviz": GraphvizAnalysisCard,
+}
+
 
 def _cast_arm_parameters(arm: Arm, search_space: SearchSpace) -> None:
     """Cast arm parameter values to the appropriate Python type.
@@ -110,9 +129,10 @@ def _cast_arm_parameters(arm: Arm, search_space: SearchSpace) -> None:
         arm: The arm whose parameter values should be cast.
         search_space: The search space containing parameter type information.
     """
+    parameters = search_space.parameters
     for param_name, param_value in arm._parameters.items():
-        if param_name in search_space.parameters:
-            parameter = search_space.parameters[param_name]
+        parameter = parameters.get(param_name)
+        if parameter is not None:
             arm._parameters[param_name] = _cast_parameter_value(
                 param_value, parameter.parameter_type
             )
@@ -149,16 +169,39 @@ class Decoder:
     def _auxiliary_experiments_by_purpose_from_experiment_sqa(
         self, experiment_sqa: SQAExperiment, reduced_state: bool = False
     ) -> dict[AuxiliaryExperimentPurpose, list[AuxiliaryExperiment]] | None:
+        """Load the auxiliary experiments of ``experiment_sqa`` by purpose.
+
+        A source experiment referenced under several purposes is decoded only
+        once: every ``AuxiliaryExperiment`` referring to it shares the same
+        ``Experiment`` and ``Data`` objects (each keeps its own ``is_active``), so
+        mutating the experiment of one purpose is visible through the others.
+        """
         auxiliary_experiments_by_purpose = {}
+        loaded_by_name: dict[str, AuxiliaryExperiment] = {}
+
+        def _load_auxiliary_experiment(
+            experiment_name: str, is_active: bool
+        ) -> AuxiliaryExperiment:
+            loaded = loaded_by_name.get(experiment_name)
+            if loaded is None:
+                loaded = auxiliary_experiment_from_name(
+                    experiment_name=experiment_name,
+                    config=self.config,
+                    is_active=is_active,
+                    reduced_state=reduced_state,
+                )
+                loaded_by_name[experiment_name] = loaded
+                return loaded
+            return AuxiliaryExperiment(
+                loaded.experiment, is_active=is_active, data=loaded.data
+            )
 
         # Legacy logic
         if experiment_sqa.auxiliary_experiments_by_purpose:
             aux_exps_dict = none_throws(experiment_sqa.auxiliary_experiments_by_purpose)
             for aux_exp_purpose_str, aux_exps_json in aux_exps_dict.items():
-                aux_exp_purpose = next(
-                    member
-                    for member in self.config.auxiliary_experiment_purpose_enum
-                    if member.value == aux_exp_purpose_str
+                aux_exp_purpose = self.config.auxiliary_experiment_purpose_enum(
+                    aux_exp_purpose_str
                 )
                 if aux_exp_purpose not in auxiliary_experiments_by_purpose:
                     auxiliary_experiments_by_purpose[aux_exp_purpose] = []
@@ -167,11 +210,9 @@ class Decoder:
                     # we used to save only the experiment name
                     if isinstance(aux_exp_json, str):
                         aux_exp_json = {"experiment_name": aux_exp_json}
-                    aux_experiment = auxiliary_experiment_from_name(
+                    aux_experiment = _load_auxiliary_experiment(
                         experiment_name=aux_exp_json["experiment_name"],
-                        config=self.config,
                         is_active=True,
-                        reduced_state=reduced_state,
                     )
                     auxiliary_experiments_by_purpose[aux_exp_purpose].append(
                         aux_experiment
@@ -179,27 +220,29 @@ class Decoder:
 
         # New logic
         if experiment_sqa.auxiliary_experiments:
+            # DB ids of the auxiliary experiments already loaded for each purpose.
+            loaded_db_ids_by_purpose = {
+                purpose: {aux_exp.experiment.db_id for aux_exp in aux_exps}
+                for purpose, aux_exps in auxiliary_experiments_by_purpose.items()
+            }
             for auxiliary_experiment_sqa in experiment_sqa.auxiliary_experiments:
                 purpose = self.config.auxiliary_experiment_purpose_enum(
                     auxiliary_experiment_sqa.purpose
                 )
                 if purpose not in auxiliary_experiments_by_purpose:
                     auxiliary_experiments_by_purpose[purpose] = []
+                    loaded_db_ids_by_purpose[purpose] = set()
                 # If the auxiliary experiment is already loaded, we don't need to
                 # load it again.
-                if any(
-                    auxiliary_experiment_sqa.source_experiment_id
-                    == aux_exp.experiment.db_id
-                    for aux_exp in auxiliary_experiments_by_purpose[purpose]
-                ):
+                source_experiment_id = auxiliary_experiment_sqa.source_experiment_id
+                if source_experiment_id in loaded_db_ids_by_purpose[purpose]:
                     continue
-                aux_experiment = auxiliary_experiment_from_name(
+                aux_experiment = _load_auxiliary_experiment(
                     experiment_name=auxiliary_experiment_sqa.source_experiment.name,
-                    config=self.config,
                     is_active=auxiliary_experiment_sqa.is_active,
-                    reduced_state=reduced_state,
                 )
                 auxiliary_experiments_by_purpose[purpose].append(aux_experiment)
+                loaded_db_ids_by_purpose[purpose].add(aux_experiment.experiment.db_id)
         # pyrefly: ignore [bad-return]
         return auxiliary_experiments_by_purpose
 
@@ -432,19 +475,20 @@ class Decoder:
 
         experiment._trials = {trial.index: trial for trial in trials}
         experiment._arms_by_name = {}
+        if any(trial.ttl_seconds is not None for trial in trials):
+            experiment._trials_have_ttl = True
+        search_space = experiment.search_space
         for trial in trials:
-            if trial.ttl_seconds is not None:
-                experiment._trials_have_ttl = True
             for arm in trial.arms:
                 # Cast arm parameter values to the appropriate type based on the
                 # search space parameter types. This is necessary because SQA may
                 # deserialize values as different types (e.g., ints as floats).
-                _cast_arm_parameters(arm, experiment.search_space)
+                _cast_arm_parameters(arm, search_space)
                 experiment._register_arm(arm)
         if experiment.status_quo is not None:
             sq = none_throws(experiment.status_quo)
             # Cast status_quo arm parameter values as well.
-            _cast_arm_parameters(sq, experiment.search_space)
+            _cast_arm_parameters(sq, search_space)
             experiment._register_arm(sq)
         experiment._time_created = experiment_sqa.time_created
         experiment._status = experiment_sqa.status
@@ -601,16 +645,17 @@ class Decoder:
         """Convert SQLAlchemy Metric to Ax Metric, Objective, or OutcomeConstraint."""
 
         metric = self._metric_from_sqa_util(metric_sqa)
+        intent = metric_sqa.intent
 
-        if metric_sqa.intent == MetricIntent.TRACKING:
+        if intent == MetricIntent.TRACKING:
             return metric
-        elif metric_sqa.intent == MetricIntent.OBJECTIVE:
+        elif intent == MetricIntent.OBJECTIVE:
             return self._objective_from_sqa(metric=metric, metric_sqa=metric_sqa)
         elif (
-            metric_sqa.intent == MetricIntent.MULTI_OBJECTIVE
+            intent == MetricIntent.MULTI_OBJECTIVE
             # metric_sqa is a parent whose children are individual
             # metrics in MultiObjective
-            or metric_sqa.intent == MetricIntent.PREFERENCE_OBJECTIVE
+            or intent == MetricIntent.PREFERENCE_OBJECTIVE
             # PREFERENCE_OBJECTIVE stores a MultiObjective, similar to
             # MULTI_OBJECTIVE. The config-level properties
             # (preference_profile_name, expect_relativized_outcomes) are stored
@@ -620,19 +665,19 @@ class Decoder:
         ):
             return self._multi_objective_from_sqa(parent_metric_sqa=metric_sqa)
         elif (
-            metric_sqa.intent == MetricIntent.SCALARIZED_OBJECTIVE
+            intent == MetricIntent.SCALARIZED_OBJECTIVE
         ):  # metric_sqa is a parent whose children are individual
             # metrics in Scalarized Objective
             return self._scalarized_objective_from_sqa(parent_metric_sqa=metric_sqa)
-        elif metric_sqa.intent == MetricIntent.OUTCOME_CONSTRAINT:
+        elif intent == MetricIntent.OUTCOME_CONSTRAINT:
             return self._outcome_constraint_from_sqa(
                 metric=metric, metric_sqa=metric_sqa
             )
-        elif metric_sqa.intent == MetricIntent.SCALARIZED_OUTCOME_CONSTRAINT:
+        elif intent == MetricIntent.SCALARIZED_OUTCOME_CONSTRAINT:
             return self._scalarized_outcome_constraint_from_sqa(
                 metric=metric, metric_sqa=metric_sqa
             )
-        elif metric_sqa.intent == MetricIntent.OBJECTIVE_THRESHOLD:
+        elif intent == MetricIntent.OBJECTIVE_THRESHOLD:
             return self._objective_threshold_from_sqa(
                 metric=metric, metric_sqa=metric_sqa
             )
@@ -815,14 +860,12 @@ class Decoder:
                 without search space and optimization config. Unlike `reduced_state`,
                 we do still load model state.
         """
-        arms = []
-        weights = []
+        arms_sqa = generator_run_sqa.arms
+        arms = [self.arm_from_sqa(arm_sqa=arm_sqa) for arm_sqa in arms_sqa]
+        weights = [arm_sqa.weight for arm_sqa in arms_sqa]
         opt_config = None
         search_space = None
 
-        for arm_sqa in generator_run_sqa.arms:
-            arms.append(self.arm_from_sqa(arm_sqa=arm_sqa))
-            weights.append(arm_sqa.weight)
         if not reduced_state and not immutable_search_space_and_opt_config:
             # Check if metrics, parameters, and parameter constraints are present
             # on the generator run SQA object, since these attributes
@@ -854,39 +897,31 @@ class Decoder:
 
         best_arm_predictions: tuple[Arm, TModelPredictArm | None] | None = None
         model_predictions: TModelPredict | None = None
-        if (
-            generator_run_sqa.best_arm_parameters is not None
-            and generator_run_sqa.best_arm_predictions is not None
-        ):
+        best_arm_parameters = generator_run_sqa.best_arm_parameters
+        raw_predictions = generator_run_sqa.best_arm_predictions
+        if best_arm_parameters is not None and raw_predictions is not None:
             best_arm = Arm(
                 name=generator_run_sqa.best_arm_name,
-                parameters=none_throws(generator_run_sqa.best_arm_parameters),
+                parameters=best_arm_parameters,
             )
-            raw_predictions = none_throws(generator_run_sqa.best_arm_predictions)
             best_arm_predictions = (
                 best_arm,
                 cast(TModelPredictArm, tuple(raw_predictions)),
             )
-        if generator_run_sqa.model_predictions is not None:
-            raw_model_predictions = none_throws(generator_run_sqa.model_predictions)
+        raw_model_predictions = generator_run_sqa.model_predictions
+        if raw_model_predictions is not None:
             model_predictions = cast(TModelPredict, tuple(raw_model_predictions))
 
+        fit_time = generator_run_sqa.fit_time
+        gen_time = generator_run_sqa.gen_time
         generator_run = GeneratorRun(
             arms=arms,
             # pyrefly: ignore [bad-argument-type]
             weights=weights,
             optimization_config=opt_config,
             search_space=search_space,
-            fit_time=(
-                None
-                if generator_run_sqa.fit_time is None
-                else float(generator_run_sqa.fit_time)
-            ),
-            gen_time=(
-                None
-                if generator_run_sqa.gen_time is None
-                else float(generator_run_sqa.gen_time)
-            ),
+            fit_time=None if fit_time is None else float(fit_time),
+            gen_time=None if gen_time is None else float(gen_time),
             best_arm_predictions=best_arm_predictions,
             model_predictions=model_predictions,
             generator_key=generator_run_sqa.model_key,
@@ -934,19 +969,13 @@ class Decoder:
             generation_node_name=generator_run_sqa.generation_node_name,
             suggested_experiment_status=generator_run_sqa.suggested_experiment_status,
         )
-        # Remove deprecated kwargs from generator kwargs & adapter kwargs.
-        if generator_run._generator_kwargs is not None:
-            generator_run._generator_kwargs = {
-                k: v
-                for k, v in generator_run._generator_kwargs.items()
-                if k not in _DEPRECATED_GENERATOR_KWARGS
-            }
-        if generator_run._adapter_kwargs is not None:
-            generator_run._adapter_kwargs = {
-                k: v
-                for k, v in generator_run._adapter_kwargs.items()
-                if k not in _DEPRECATED_GENERATOR_KWARGS
-            }
+        # Remove deprecated kwargs from generator kwargs & adapter kwargs. Both
+        # dicts were freshly created by `object_from_json` above, so they can be
+        # filtered in place.
+        for kwargs in (generator_run._generator_kwargs, generator_run._adapter_kwargs):
+            if kwargs is not None:
+                for k in _DEPRECATED_GENERATOR_KWARGS:
+                    kwargs.pop(k, None)
         generator_run._time_created = generator_run_sqa.time_created
         generator_run._generator_run_type = self.get_enum_name(
             value=generator_run_sqa.generator_run_type,
@@ -1039,12 +1068,12 @@ class Decoder:
 
     def runner_from_sqa(self, runner_sqa: SQARunner) -> Runner:
         """Convert SQLAlchemy Runner to Ax Runner."""
-        if runner_sqa.runner_type not in self.config.reverse_runner_registry:
+        runner_class = self.config.reverse_runner_registry.get(runner_sqa.runner_type)
+        if runner_class is None:
             raise SQADecodeError(
                 f"Cannot decode SQARunner because {runner_sqa.runner_type} "
                 f"is an invalid type. "
             )
-        runner_class = self.config.reverse_runner_registry[runner_sqa.runner_type]
 
         args = runner_class.deserialize_init_args(
             args=deepcopy(dict(runner_sqa.properties or {})),
@@ -1119,13 +1148,8 @@ class Decoder:
                     immutable_search_space_and_opt_config=immutable_ss_and_oc,
                 )
         trial._trial_type = trial_sqa.trial_type
-        # Swap `DISPATCHED` for `RUNNING`, since `DISPATCHED` is deprecated and nearly
-        # equivalent to `RUNNING`.
-        trial._status = (
-            trial_sqa.status
-            if trial_sqa.status != TrialStatus.DISPATCHED
-            else TrialStatus.RUNNING
-        )
+        status = trial_sqa.status
+        trial._status = _DEPRECATED_TRIAL_STATUS_REPLACEMENTS.get(status, status)
         trial._time_created = trial_sqa.time_created
         trial._time_completed = trial_sqa.time_completed
         trial._time_staged = trial_sqa.time_staged
@@ -1164,17 +1188,15 @@ class Decoder:
         analysis_card_sqa: SQAAnalysisCard,
     ) -> AnalysisCardBase:
         """Convert SQLAlchemy AnalysisCard to Ax AnalysisCard."""
-        children = analysis_card_sqa.children
-
-        if len(children) > 0:
-            # Decode children and collect index
-            index_to_child_card = {
-                child.order: self.analysis_card_from_sqa(analysis_card_sqa=child)
-                for child in children
-            }
-
-            # Sort children by index
-            children = [card for _order, card in sorted(index_to_child_card.items())]
+        children_sqa = analysis_card_sqa.children
+
+        if len(children_sqa) > 0:
+            # Children are already loaded with the root card, so decoding them in
+            # index order does not hit the database.
+            children = [
+                self.analysis_card_from_sqa(analysis_card_sqa=child)
+                for child in sorted(children_sqa, key=attrgetter("order"))
+            ]
 
             # Convert None value of title to empty string to ensure compatibility with
             # AnalysisCardGroup constructor. Subtitle can be None.
@@ -1194,63 +1216,10 @@ class Decoder:
         title = none_throws(analysis_card_sqa.title)
         subtitle = none_throws(analysis_card_sqa.subtitle)
         blob = none_throws(analysis_card_sqa.blob)
-        blob_annotation = analysis_card_sqa.blob_annotation
-
-        if blob_annotation == "not_applicable_state":
-            return NotApplicableStateAnalysisCard(
-                name=analysis_card_sqa.name,
-                title=title,
-                subtitle=subtitle,
-                df=read_json(StringIO(analysis_card_sqa.dataframe_json)),
-                blob=blob,
-                timestamp=analysis_card_sqa.timestamp,
-            )
-        if blob_annotation == "error":
-            return ErrorAnalysisCard(
-                name=analysis_card_sqa.name,
-                title=title,
-                subtitle=subtitle,
-                df=read_json(StringIO(analysis_card_sqa.dataframe_json)),
-                blob=blob,
-                timestamp=analysis_card_sqa.timestamp,
-            )
-        if blob_annotation == "plotly":
-            return PlotlyAnalysisCard(
-                name=analysis_card_sqa.name,
-                title=title,
-                subtitle=subtitle,
-                df=read_json(StringIO(analysis_card_sqa.dataframe_json)),
-                blob=blob,
-                timestamp=analysis_card_sqa.timestamp,
-            )
-        if blob_annotation == "markdown":
-            return MarkdownAnalysisCard(
-                name=analysis_card_sqa.name,
-                title=title,
-                subtitle=subtitle,
-                df=read_json(StringIO(analysis_card_sqa.dataframe_json)),
-                blob=blob,
-                timestamp=analysis_card_sqa.timestamp,
-            )
-        if blob_annotation == "healthcheck":
-            return HealthcheckAnalysisCard(
-                name=analysis_card_sqa.name,
-                title=title,
-                subtitle=subtitle,
-                df=read_json(StringIO(analysis_card_sqa.dataframe_json)),
-                blob=blob,
-                timestamp=analysis_card_sqa.timestamp,
-            )
-        if blob_annotation == "graphviz":
-            return GraphvizAnalysisCard(
-                name=analysis_card_sqa.name,
-                title=title,
-                subtitle=subtitle,
-                df=read_json(StringIO(analysis_card_sqa.dataframe_json)),
-                blob=blob,
-                timestamp=analysis_card_sqa.timestamp,
-            )
-        return AnalysisCard(
+        card_class = _ANALYSIS_CARD_CLASS_BY_BLOB_ANNOTATION.get(
+            analysis_card_sqa.blob_annotation, AnalysisCard
+        )
+        return card_class(
             name=analysis_card_sqa.name,
             title=title,
             subtitle=subtitle,
@@ -1261,12 +1230,12 @@ class Decoder:
 
     def _metric_from_sqa_util(self, metric_sqa: SQAMetric) -> Metric:
         """Convert SQLAlchemy Metric to Ax Metric"""
-        if metric_sqa.metric_type not in self.config.reverse_metric_registry:
+        metric_class = self.config.reverse_metric_registry.get(metric_sqa.metric_type)
+        if metric_class is None:
             raise SQADecodeError(
                 f"Cannot decode SQAMetric because {metric_sqa.metric_type} "
                 f"is an invalid type. "
             )
-        metric_class = self.config.reverse_metric_registry[metric_sqa.metric_type]
 
         args = dict(
             object_from_json(
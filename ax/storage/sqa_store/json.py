@@ -11,6 +11,7 @@ from json import JSONDecodeError
 from typing import Any
 
 from ax.storage.sqa_store.db import JSON_FIELD_LENGTH, LONGTEXT_BYTES, MEDIUMTEXT_BYTES
+from ax.utils.common.serialization import json_loads
 from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.types import Text, TypeDecorator, VARCHAR
 
@@ -47,6 +48,8 @@ class JSONEncodedObject(TypeDecorator):
     def process_result_value(self, value: Any, dialect: Any) -> Any:
         if value is not None:
             try:  # TODO T61331534: revert this; just a hotfix for AutoML
+                if self.object_pairs_hook is None:
+                    return json_loads(value)
                 # pyre-fixme[6]: `object_pairs_hook` expects a callable but
                 #  `type[Any] | None` is stored; compatible at runtime.
                 return json.loads(value, object_pairs_hook=self.object_pairs_hook)
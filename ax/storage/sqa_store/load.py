@@ -56,7 +56,7 @@ from ax.storage.sqa_store.sqa_config import SQAConfig
 from ax.storage.utils import MetricIntent
 from ax.utils.common.constants import Keys
 from pyre_extensions import assert_is_instance, none_throws
-from sqlalchemy.orm import defaultload, joinedload, noload
+from sqlalchemy.orm import defaultload, joinedload, noload, selectinload
 from sqlalchemy.orm.exc import DetachedInstanceError
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -144,6 +144,7 @@ def _load_experiment(
         type[SQAAuxiliaryExperiment],
         decoder.config.class_to_sqa_class[AuxiliaryExperiment],
     )
+    metric_sqa_class = cast(type[SQAMetric], decoder.config.class_to_sqa_class[Metric])
     imm_OC_and_SS = _get_experiment_immutable_opt_config_and_search_space(
         experiment_name=experiment_name, exp_sqa_class=exp_sqa_class
     )
@@ -163,6 +164,7 @@ def _load_experiment(
         exp_sqa_class=exp_sqa_class,
         trial_sqa_class=trial_sqa_class,
         auxiliary_experiment_sqa_class=auxiliary_experiment_sqa_class,
+        metric_sqa_class=metric_sqa_class,
         load_trials_in_batches_of_size=load_trials_in_batches_of_size,
         skip_runners_and_metrics=skip_runners_and_metrics,
     )
@@ -211,6 +213,7 @@ def _get_experiment_sqa(
     exp_sqa_class: type[SQAExperiment],
     trial_sqa_class: type[SQATrial],
     auxiliary_experiment_sqa_class: type[SQAAuxiliaryExperiment],
+    metric_sqa_class: type[SQAMetric],
     trials_query_options: list[Any] | None = None,
     load_trials_in_batches_of_size: int | None = None,
     skip_runners_and_metrics: bool = False,
@@ -225,6 +228,8 @@ def _get_experiment_sqa(
         auxiliary_experiment_sqa_class: The SQLAlchemy class used to query the
             auxiliary experiments for the experiment, and specify that the source
             experiment should be eagerly loaded
+        metric_sqa_class: The SQLAlchemy class of the experiment's metrics, used to
+            eagerly load the children of multi-objective / scalarized metrics
         trials_query_options: Optional list of query options to apply when
             retrieving trials
         load_trials_in_batches_of_size: If specified, load trials in batches of
@@ -248,9 +253,23 @@ def _get_experiment_sqa(
                 # Also prevent loading AnalysisCards, which can be expensive and is not
                 # necessary to reconstruct the Experiment
                 noload(exp_sqa_class.analysis_cards),
-                # Eagerly load target experiment for auxiliary experiment relationships
-                joinedload(exp_sqa_class.auxiliary_experiments).joinedload(
-                    auxiliary_experiment_sqa_class.source_experiment,
+                # Eagerly load target experiment for auxiliary experiment
+                # relationships. `selectinload` for the collection avoids
+                # duplicating experiment rows per auxiliary experiment; only the
+                # name of the source experiment is needed here (it is loaded
+                # separately by the decoder), so leave its own relationships
+                # unloaded.
+                selectinload(exp_sqa_class.auxiliary_experiments)
+                .joinedload(auxiliary_experiment_sqa_class.source_experiment)
+                .lazyload("*"),
+                # Load children of multi-objective / scalarized metrics with one
+                # batched query each; otherwise the decoder has to fetch them
+                # per parent metric once the session is closed.
+                defaultload(exp_sqa_class.metrics).selectinload(
+                    metric_sqa_class.scalarized_objective_children_metrics
+                ),
+                defaultload(exp_sqa_class.metrics).selectinload(
+                    metric_sqa_class.scalarized_outcome_constraint_children_metrics
                 ),
             )
         )
@@ -349,6 +368,7 @@ def _get_experiment_sqa_reduced_state(
     exp_sqa_class: type[SQAExperiment],
     trial_sqa_class: type[SQATrial],
     auxiliary_experiment_sqa_class: type[SQAAuxiliaryExperiment],
+    metric_sqa_class: type[SQAMetric],
     load_trials_in_batches_of_size: int | None = None,
     skip_runners_and_metrics: bool = False,
 ) -> SQAExperiment:
@@ -364,6 +384,7 @@ def _get_experiment_sqa_reduced_state(
         exp_sqa_class=exp_sqa_class,
         trial_sqa_class=trial_sqa_class,
         auxiliary_experiment_sqa_class=auxiliary_experiment_sqa_class,
+        metric_sqa_class=metric_sqa_class,
         trials_query_options=options,
         load_trials_in_batches_of_size=load_trials_in_batches_of_size,
         skip_runners_and_metrics=skip_runners_and_metrics,
@@ -375,6 +396,7 @@ def _get_experiment_sqa_immutable_opt_config_and_search_space(
     exp_sqa_class: type[SQAExperiment],
     trial_sqa_class: type[SQATrial],
     auxiliary_experiment_sqa_class: type[SQAAuxiliaryExperiment],
+    metric_sqa_class: type[SQAMetric],
     load_trials_in_batches_of_size: int | None = None,
     skip_runners_and_metrics: bool = False,
 ) -> SQAExperiment:
@@ -389,6 +411,7 @@ def _get_experiment_sqa_immutable_opt_config_and_search_space(
         exp_sqa_class=exp_sqa_class,
         trial_sqa_class=trial_sqa_class,
         auxiliary_experiment_sqa_class=auxiliary_experiment_sqa_class,
+        metric_sqa_class=metric_sqa_class,
         trials_query_options=get_query_options_to_defer_immutable_duplicates(),
         load_trials_in_batches_of_size=load_trials_in_batches_of_size,
         skip_runners_and_metrics=skip_runners_and_metrics,
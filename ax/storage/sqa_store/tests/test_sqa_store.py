@@ -6,7 +6,9 @@
 
 # pyre-strict
 
+import json
 import logging
+import math
 from collections.abc import Callable
 from datetime import datetime
 from decimal import Decimal
@@ -103,6 +105,7 @@ from ax.storage.sqa_store.delete import delete_experiment, delete_generation_str
 from ax.storage.sqa_store.encoder import Encoder
 from ax.storage.sqa_store.load import (
     _get_experiment_immutable_opt_config_and_search_space,
+    _get_experiment_sqa,
     _get_experiment_sqa_immutable_opt_config_and_search_space,
     _get_generation_strategy_sqa_immutable_opt_config_and_search_space,
     _query_historical_experiments_given_parameters,
@@ -139,10 +142,11 @@ from ax.storage.sqa_store.sqa_classes import (
 )
 from ax.storage.sqa_store.sqa_config import SQAConfig
 from ax.storage.sqa_store.tests.utils import TEST_CASES
+from ax.storage.sqa_store.utils import are_relationships_loaded
 from ax.storage.utils import DomainType, MetricIntent, ParameterConstraintType
 from ax.utils.common.constants import Keys
 from ax.utils.common.logger import get_logger
-from ax.utils.common.serialization import serialize_init_args
+from ax.utils.common.serialization import json_loads, serialize_init_args
 from ax.utils.common.testutils import TestCase
 from ax.utils.testing.core_stubs import (
     CustomTestMetric,
@@ -371,6 +375,47 @@ class SQAStoreTest(TestCase):
             loaded_experiment = load_experiment(exp.name)
             self.assertEqual(loaded_experiment, exp)
 
+    def test_experiment_load_eagerly_loads_scalarized_children_metrics(self) -> None:
+        experiment = get_experiment_with_scalarized_objective_and_outcome_constraint()
+        save_experiment(experiment)
+
+        loaded_experiment_sqas = []
+
+        def _get_experiment_sqa_and_record(**kwargs: Any) -> SQAExperiment:
+            experiment_sqa = _get_experiment_sqa(**kwargs)
+            loaded_experiment_sqas.append(experiment_sqa)
+            return experiment_sqa
+
+        with patch(
+            f"{_get_experiment_sqa.__module__}._get_experiment_sqa",
+            side_effect=_get_experiment_sqa_and_record,
+        ):
+            loaded_experiment = load_experiment(experiment.name)
+        self.assertEqual(loaded_experiment, experiment)
+
+        # The children of scalarized metrics come back with the experiment
+        # query, so decoding them needs no further per-metric queries.
+        (experiment_sqa,) = loaded_experiment_sqas
+        children_relationships = [
+            "scalarized_objective_children_metrics",
+            "scalarized_outcome_constraint_children_metrics",
+        ]
+        for metric_sqa in experiment_sqa.metrics:
+            self.assertTrue(
+                are_relationships_loaded(
+                    sqa_object=metric_sqa, relationship_names=children_relationships
+                )
+            )
+        self.assertTrue(
+            any(m.scalarized_objective_children_metrics for m in experiment_sqa.metrics)
+        )
+        self.assertTrue(
+            any(
+                m.scalarized_outcome_constraint_children_metrics
+                for m in experiment_sqa.metrics
+            )
+        )
+
     def test_arm_parameter_values_cast_to_parameter_type(self) -> None:
         """Test that arm parameter values are cast to the appropriate type on load.
 
@@ -476,6 +521,45 @@ class SQAStoreTest(TestCase):
         self.assertEqual(experiment_w_aux_exp, loaded_experiment)
         self.assertEqual(len(loaded_experiment.auxiliary_experiments_by_purpose), 1)
 
+    def test_loading_aux_exp_referenced_under_several_purposes(self) -> None:
+        aux_experiment = Experiment(
+            name="test_shared_aux_exp_in_SQAStoreTest",
+            search_space=get_search_space(),
+            is_test=True,
+        )
+        save_experiment(aux_experiment, config=self.config)
+        purpose_enum = cast(
+            type[AuxiliaryExperimentPurpose],
+            self.config.auxiliary_experiment_purpose_enum,
+        )
+        experiment_w_aux_exp = Experiment(
+            name="test_experiment_w_shared_aux_exp_in_SQAStoreTest",
+            search_space=get_search_space(),
+            is_test=True,
+            auxiliary_experiments_by_purpose={
+                purpose_enum.PE_EXPERIMENT: [
+                    AuxiliaryExperiment(experiment=aux_experiment)
+                ],
+                purpose_enum.BO_EXPERIMENT: [
+                    AuxiliaryExperiment(experiment=aux_experiment, is_active=False)
+                ],
+            },
+        )
+        save_experiment(experiment_w_aux_exp, config=self.config)
+        loaded_experiment = load_experiment(
+            experiment_w_aux_exp.name, config=self.config
+        )
+        aux_exps_by_purpose = loaded_experiment.auxiliary_experiments_by_purpose
+        pe_aux_exp = aux_exps_by_purpose[purpose_enum.PE_EXPERIMENT][0]
+        bo_aux_exp = aux_exps_by_purpose[purpose_enum.BO_EXPERIMENT][0]
+        # The source experiment is decoded once and shared between purposes,
+        # while each reference keeps its own `is_active` flag.
+        self.assertIsNot(pe_aux_exp, bo_aux_exp)
+        self.assertIs(pe_aux_exp.experiment, bo_aux_exp.experiment)
+        self.assertIs(pe_aux_exp.data, bo_aux_exp.data)
+        self.assertTrue(pe_aux_exp.is_active)
+        self.assertFalse(bo_aux_exp.is_active)
+
     def test_saving_and_loading_experiment_with_aux_exp_reduced_state(self) -> None:
         aux_exp = Experiment(
             name="test_aux_exp_in_SQAStoreTest_reduced_state",
@@ -1030,6 +1114,23 @@ class SQAStoreTest(TestCase):
         loaded_experiment = load_experiment(self.experiment.name)
         self.assertEqual(self.experiment, loaded_experiment)
 
+    def test_non_finite_json_column_round_trip(self) -> None:
+        # `json.dumps` writes NaN / Infinity tokens, which `json_loads` must still
+        # parse when reading JSON-encoded columns back.
+        trial = self.experiment.trials[0]
+        trial._run_metadata = {"nan": float("nan"), "inf": [math.inf, -math.inf]}
+        save_experiment(self.experiment)
+
+        with patch(
+            "ax.storage.sqa_store.json.json_loads", wraps=json_loads
+        ) as mock_json_loads:
+            loaded_experiment = load_experiment(self.experiment.name)
+        mock_json_loads.assert_any_call(json.dumps(trial.run_metadata))
+        run_metadata = loaded_experiment.trials[0].run_metadata
+        self.assertEqual(set(run_metadata), {"nan", "inf"})
+        self.assertTrue(math.isnan(run_metadata["nan"]))
+        self.assertEqual(run_metadata["inf"], [math.inf, -math.inf])
+
     def test_experiment_save_and_update_trials(self) -> None:
         save_experiment(self.experiment)
 
@@ -2578,6 +2679,28 @@ class SQAStoreTest(TestCase):
         )
         self.assertEqual(decoded_gr.gen_metadata, gen_metadata)
 
+    def test_generator_run_deprecated_kwargs_removed(self) -> None:
+        gr = GeneratorRun(
+            arms=[],
+            generator_kwargs={"fit_on_update": True, "foo": 1},
+            adapter_kwargs={"status_quo_name": "status_quo", "bar": 2},
+        )
+        generator_run_sqa = self.encoder.generator_run_to_sqa(gr)
+        decoded_gr = self.decoder.generator_run_from_sqa(
+            generator_run_sqa, False, False
+        )
+        self.assertEqual(decoded_gr._generator_kwargs, {"foo": 1})
+        self.assertEqual(decoded_gr._adapter_kwargs, {"bar": 2})
+        # The deprecated kwargs are only dropped from the decoded generator run;
+        # the SQA row is left untouched.
+        self.assertEqual(
+            generator_run_sqa.model_kwargs, {"fit_on_update": True, "foo": 1}
+        )
+        self.assertEqual(
+            generator_run_sqa.bridge_kwargs,
+            {"status_quo_name": "status_quo", "bar": 2},
+        )
+
     def test_generator_run_suggested_experiment_status(self) -> None:
         # Test round-trip with a status set.
         gr = GeneratorRun(
@@ -9,15 +9,38 @@
 from __future__ import annotations
 
 import inspect
+import json
 from collections.abc import Callable
 from typing import Any, TypeVar, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 T = TypeVar("T")
 TDecoderRegistry = dict[str, Union[type[T], Callable[..., T]]]
 TClassDecoderRegistry = dict[str, Callable[[dict[str, Any]], Any]]
 
 
+def json_loads(s: str | bytes) -> Any:
+    """Parse a JSON document, using ``orjson`` if it is installed.
+
+    ``orjson`` is considerably faster than the standard library parser on large
+    documents (e.g. serialized experiments), but it is stricter: it rejects the
+    ``NaN`` / ``Infinity`` tokens that ``json.dumps`` emits by default. Such
+    documents fall back to ``json.loads``, so the result is always the same as
+    that of ``json.loads``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(s)
+
+
 # https://stackoverflow.com/a/39235373
 def named_tuple_to_dict(data: Any) -> Any:
     """Recursively convert NamedTuples to dictionaries."""
@@ -6,11 +6,17 @@
 
 # pyre-strict
 
+import math
 from typing import NamedTuple
+from unittest import mock, skipUnless
 
-from ax.utils.common.serialization import named_tuple_to_dict
+from ax.utils.common import serialization
+from ax.utils.common.serialization import json_loads, named_tuple_to_dict
 from ax.utils.common.testutils import TestCase
 
+_JSON_DOC = '{"a": [1, 2.5, "x", null, true], "b": {"c": -3}}'
+_JSON_EXPECTED = {"a": [1, 2.5, "x", None, True], "b": {"c": -3}}
+
 
 class TestSerializationUtils(TestCase):
     def test_named_tuple_to_dict(self) -> None:
@@ -26,3 +32,27 @@ class TestSerializationUtils(TestCase):
             named_tuple_to_dict(bar),
             {"x": 5, "foo": {"x": 5, "y": "g"}, "y": [(1, True), {"x": 5, "y": "g"}]},
         )
+
+    @skipUnless(serialization.orjson is not None, "requires orjson")
+    def test_json_loads_with_orjson(self) -> None:
+        orjson = serialization.orjson
+        with mock.patch.object(orjson, "loads", wraps=orjson.loads) as mock_loads:
+            self.assertEqual(json_loads(_JSON_DOC), _JSON_EXPECTED)
+            self.assertEqual(json_loads(_JSON_DOC.encode()), _JSON_EXPECTED)
+            self.assertEqual(mock_loads.call_count, 2)
+            # Non-standard tokens written by `json.dumps` are rejected by orjson
+            # and fall back to the standard library parser.
+            self._assert_loads_non_finite()
+            self.assertEqual(mock_loads.call_count, 3)
+
+    def test_json_loads_without_orjson(self) -> None:
+        with mock.patch.object(serialization, "orjson", None):
+            self.assertEqual(json_loads(_JSON_DOC), _JSON_EXPECTED)
+            self.assertEqual(json_loads(_JSON_DOC.encode()), _JSON_EXPECTED)
+            self._assert_loads_non_finite()
+
+    def _assert_loads_non_finite(self) -> None:
+        parsed = json_loads('{"a": NaN, "b": Infinity, "c": -Infinity}')
+        self.assertTrue(math.isnan(parsed["a"]))
+        self.assertEqual(parsed["b"], math.inf)
+        self.assertEqual(parsed["c"], -math.inf)
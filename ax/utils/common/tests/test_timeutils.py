@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from ax.utils.common.testutils import TestCase
+from ax.utils.common.timeutils import timestamps_in_range, timestamps_in_range_array
+
+
+class TimeUtilsTest(TestCase):
+    def test_timestamps_in_range_array(self) -> None:
+        start = datetime(2024, 1, 1)
+        delta = timedelta(hours=6)
+        for end in (
+            # End point lands on a step and is included.
+            datetime(2024, 1, 3),
+            # End point falls between steps.
+            datetime(2024, 1, 3, 5),
+        ):
+            with self.subTest(end=end):
+                self.assertEqual(
+                    timestamps_in_range_array(start, end, delta)
+                    .to_pydatetime()
+                    .tolist(),
+                    list(timestamps_in_range(start, end, delta)),
+                )
+                self.assertEqual(len(timestamps_in_range_array(start, end, delta)), 9)
+
+    def test_timestamps_in_range_array_dst(self) -> None:
+        # Clocks in New York spring forward on 2024-03-10 at 2am.
+        tz = ZoneInfo("America/New_York")
+        start = datetime(2024, 3, 9, 12, tzinfo=tz)
+        end = datetime(2024, 3, 10, 12, tzinfo=tz)
+        delta = timedelta(hours=12)
+        # `timestamps_in_range` steps in wall-clock time, so it reaches 12pm on
+        # the 10th, while the array steps in absolute time and lands at 1pm,
+        # past the end.
+        self.assertEqual(
+            [ts.hour for ts in timestamps_in_range(start, end, delta)], [12, 0, 12]
+        )
+        self.assertEqual(
+            [ts.hour for ts in timestamps_in_range_array(start, end, delta)], [12, 0]
+        )
@@ -8,7 +8,8 @@
 
 from collections.abc import Generator
 from datetime import datetime, timedelta
-from time import time
+from functools import lru_cache
+from time import time_ns
 
 import pandas as pd
 
@@ -21,6 +22,8 @@ def to_ds(ts: datetime) -> str:
     return datetime.strftime(ts, DS_FRMT)
 
 
+# `datetime`s are immutable, so parsed results can be shared between callers.
+@lru_cache(maxsize=4096)
 def to_ts(ds: str) -> datetime:
     """Convert a DS string to a `datetime`."""
     return datetime.strptime(ds, DS_FRMT)
@@ -34,7 +37,8 @@ def _ts_to_pandas(ts: int) -> pd.Timestamp:
 
 def current_timestamp_in_millis() -> int:
     """Grab current timestamp in milliseconds as an int."""
-    return int(round(time() * 1000))
+    # Round to the nearest millisecond using integer arithmetic only.
+    return (time_ns() + 500_000) // 1_000_000
 
 
 def timestamps_in_range(
@@ -49,6 +53,19 @@ def timestamps_in_range(
         curr += delta
 
 
+def timestamps_in_range_array(
+    start: datetime, end: datetime, delta: timedelta
+) -> pd.DatetimeIndex:
+    """Timestamps in range [start, end], at intervals delta, built in a single
+    vectorized call. Prefer this over `timestamps_in_range` for long ranges.
+
+    Note: for timezone-aware `start` and `end`, steps are taken in absolute time
+    rather than wall-clock time, so results can differ from `timestamps_in_range`
+    across DST transitions.
+    """
+    return pd.date_range(start=start, end=end, freq=delta)
+
+
 def unixtime_to_pandas_ts(ts: float) -> pd.Timestamp:
     """Convert float unixtime into pandas timestamp (UTC)."""
     return pd.to_datetime(ts, unit="s")
@@ -95,9 +95,9 @@ def relativize(
             "all values down to zero. Try using a delta type that applies "
             "no winsorization.".format(mean_c, sem_c)
         )
-    m_t = np.array(means_t)
-    s_t = np.array(sems_t)
-    cov_t = np.array(cov_means)
+    m_t = np.asarray(means_t)
+    s_t = np.asarray(sems_t)
+    cov_t = np.asarray(cov_means)
     abs_mean_c = np.abs(mean_c)
     r_hat = (m_t - mean_c) / abs_mean_c
 
@@ -105,13 +105,16 @@ def relativize(
         var = (s_t / abs_mean_c) ** 2
     else:
         c = m_t / mean_c
+        sem_c_sq = sem_c**2
         if bias_correction and not np.all(np.isnan(sem_c)):
-            r_hat = r_hat - m_t * sem_c**2 / abs_mean_c**3
+            # Group the control-only factor so it stays a scalar for a scalar
+            # control, leaving a single elementwise multiply over `m_t`.
+            r_hat = r_hat - m_t * (sem_c_sq / abs_mean_c**3)
 
         # If everything's the same, then set r_hat to zero
         same = (m_t == mean_c) & (s_t == sem_c)
         r_hat = ~same * r_hat
-        var = ((s_t**2) - 2 * c * cov_t + (c**2) * (sem_c**2)) / (mean_c**2)
+        var = ((s_t**2) - 2 * c * cov_t + (c**2) * sem_c_sq) / (mean_c**2)
     if as_percent:
         return (r_hat * 100, np.sqrt(var) * 100)
     else:
@@ -148,9 +151,9 @@ def unrelativize(
         m_t: Inferred sample (test) means in the unrelativized scale
         s_t: Inferred SEM of sample (test) means in the unrelativized scale
     """
-    means_t = np.array(means_t, dtype=float)
-    sems_t = np.array(sems_t, dtype=float)
-    cov_means = np.array(cov_means, dtype=float)
+    means_t = np.asarray(means_t, dtype=float)
+    sems_t = np.asarray(sems_t, dtype=float)
+    cov_means = np.asarray(cov_means, dtype=float)
 
     if as_percent:
         means_t = means_t / 100
@@ -179,8 +182,10 @@ def unrelativize(
             m_t = mean_c
             s_t = sem_c
     else:
-        m_t = np.array(m_t)
-        s_t = np.array(s_t)
+        # `m_t` and `s_t` are freshly computed, so they can be updated in place;
+        # `asarray` only wraps them when they came out as numpy scalars.
+        m_t = np.asarray(m_t)
+        s_t = np.asarray(s_t)
         m_t[means_t == 0.0] = mean_c
         s_t[means_t == 0.0] = sem_c
 
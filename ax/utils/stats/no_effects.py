@@ -7,6 +7,8 @@
 # pyre-strict
 
 
+from typing import Any
+
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
@@ -67,12 +69,9 @@ def check_experiment_effects_per_metric(
     if objective_names is not None:
         cols.append("is_objective")
 
-    df_tone = pd.DataFrame(columns=cols)
-
+    rows: list[dict[str, Any]] = []
     # pyrefly: ignore [not-iterable]
-    for metric_name, trial_index in df_grouped.groups.keys():
-        dfm = df_grouped.get_group((metric_name, trial_index))
-
+    for (metric_name, trial_index), dfm in df_grouped:
         if len(dfm) < 2:
             # A single-arm group cannot show within-trial effects.
             continue
@@ -93,8 +92,9 @@ def check_experiment_effects_per_metric(
         if objective_names is not None:
             d["is_objective"] = metric_name in objective_names
 
-        df_tone = pd.concat([df_tone, pd.DataFrame([d])], ignore_index=True)
+        rows.append(d)
 
+    df_tone = pd.DataFrame(rows, columns=cols)
     df_tone["trial_index"] = df_tone["trial_index"].astype(int)
     df_tone["metric_name"] = df_tone["metric_name"].astype("string")
     df_tone["has_effect"] = df_tone["has_effect"].astype(bool)
@@ -148,8 +148,7 @@ def check_experiment_effects(
     # if list is non-empty, we'll show a warning
     ineffective_on_objectives = []
 
-    for metric in df_grouped.groups.keys():
-        dfm = df_grouped.get_group(metric)
+    for metric, dfm in df_grouped:
         p, z, null_z = ri_test_of_no_effect(
             dfm["mean"],
             dfm["sem"],
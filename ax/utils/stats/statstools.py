@@ -41,12 +41,17 @@ def inverse_variance_weight(
         )
     if len(means) != len(variances):
         raise ValueError("Means and variances must be of the same length.")
+    # Callers such as `marginal_effects` pass pandas Series; work on the
+    # underlying arrays to avoid index alignment on every operation below.
+    means = np.asarray(means)
+    variances = np.asarray(variances)
     # new_mean = \sum_i 1/var_i mean_i / \sum_i (1/var_i), unless any var = 0,
     # in which case we report the mean of all values with var = 0.
     idx_zero = variances == 0
     if idx_zero.any():
         means_z = means[idx_zero]
-        if np.var(means_z) > 0:
+        # A single zero-variance observation cannot conflict with itself.
+        if len(means_z) > 1 and np.var(means_z) > 0:
             message = "Multiple observations zero variance but different means."
             if conflicting_noiseless == "warn":
                 logger.warning(message)
@@ -132,16 +137,18 @@ def positive_part_james_stein(
             "Less than 4 measurements passed to positive_part_james_stein. "
             + "Returning raw estimates."
         )
-    sigma2_i = np.power(sems, 2)
+    sigma2_i = np.square(sems)
     ybar = np.mean(y_i)
-    s2 = np.var(y_i - ybar, ddof=3)  # sample variance normalized by K-3
+    # Deviations from the grand mean, shared by all of the estimates below.
+    dev_i = y_i - ybar
+    s2 = np.var(dev_i, ddof=3)  # sample variance normalized by K-3
     phi_i = np.ones_like(sigma2_i) if s2 == 0 else np.minimum(1, sigma2_i / s2)
-    mu_hat_i = y_i + phi_i * np.subtract(ybar, y_i)
+    mu_hat_i = y_i - phi_i * dev_i
 
     sigma_hat_i = np.sqrt(
         np.subtract(1.0, phi_i) * sigma2_i
         + phi_i * sigma2_i / K
-        + np.multiply(2, phi_i**2) * (y_i - ybar) ** 2 / (K - 3)
+        + np.multiply(2, phi_i**2) * dev_i**2 / (K - 3)
     )
     return mu_hat_i, sigma_hat_i
 
@@ -160,12 +167,15 @@ def agresti_coull_sem(
     vol. 52, no. 2, 1998, pp. 119-126. JSTOR, www.jstor.org/stable/2685469.*
 
     """
-    n_numer = np.array(n_numer)
-    n_denom = np.array(n_denom)
-    p_for_sem = (n_numer + prior_successes) / (
-        n_denom + prior_successes + prior_failures
-    )
-    sem = np.sqrt(p_for_sem * (1 - p_for_sem) / n_denom)
+    # Floats, so that the products below cannot overflow for large counts.
+    n_numer = np.asarray(n_numer, dtype=float)
+    n_denom = np.asarray(n_denom, dtype=float)
+    # p * (1 - p) / n, with p = successes / total, written without forming
+    # 1 - p, which loses precision when p is close to 1.
+    successes = n_numer + prior_successes
+    failures = n_denom - n_numer + prior_failures
+    total = successes + failures
+    sem = np.sqrt(successes * failures / (total * total * n_denom))
     return sem
 
 
@@ -192,28 +202,72 @@ def marginal_effects(
             Results are relativized as percentage changes.
     """
     covariates = covariates or [col for col in df.columns if col not in ["mean", "sem"]]
-    formatted_vals = []
-    overall_mean, overall_sem = inverse_variance_weight(
-        df["mean"],
-        np.power(df["sem"], 2),
+    means = df["mean"].to_numpy(dtype=float)
+    variances = np.square(df["sem"].to_numpy(dtype=float))
+    overall_mean, overall_sem = inverse_variance_weight(means, variances)
+
+    # Per-observation terms of the inverse variance weighted mean of each level.
+    # As in `inverse_variance_weight`, levels with any zero-variance observation
+    # instead report the mean of those observations, with zero variance.
+    is_zero = variances == 0
+    with np.errstate(divide="ignore"):
+        inv_vars = np.where(is_zero, 0.0, np.divide(1.0, variances))
+    per_obs_terms = np.stack(
+        [is_zero, inv_vars, inv_vars * means, np.where(is_zero, means, 0.0)]
     )
+
+    names: list[str] = []
+    levels: list[object] = []
+    level_means: list[npt.NDArray] = []
+    level_vars: list[npt.NDArray] = []
     for cov in covariates:
         if len(df[cov].unique()) <= 1:
             continue
-        df_gb = df.groupby(cov)
-        for name, group_df in df_gb:
-            group_mean, group_var = inverse_variance_weight(
-                group_df["mean"], np.power(group_df["sem"], 2)
-            )
-            effect, effect_sem = relativize(
-                group_mean,
-                np.sqrt(group_var),
-                overall_mean,
-                overall_sem,
-                cov_means=0.0,
-                as_percent=True,
+        # Sorted level codes, with missing levels dropped, matching `df.groupby`.
+        codes, uniques = pd.factorize(df[cov], sort=True)
+        has_level = codes >= 0
+        num_levels = len(uniques)
+        num_zero, sum_inv_vars, sum_weighted_means, sum_zero_var_means = (
+            np.bincount(codes[has_level], weights=values, minlength=num_levels)
+            for values in per_obs_terms[:, has_level]
+        )
+        has_zero = num_zero > 0
+        if has_zero.any():
+            is_zero_in_level = has_level & is_zero
+            num_distinct = (
+                pd.Series(means[is_zero_in_level])
+                .groupby(codes[is_zero_in_level])
+                .nunique()
             )
-            formatted_vals.append(
-                {"Name": cov, "Level": name, "Beta": effect, "SE": effect_sem}
+            if (num_distinct > 1).any():
+                conflicting = list(uniques[num_distinct.index[num_distinct > 1]])
+                logger.warning(
+                    "Multiple observations zero variance but different means for "
+                    f"levels {conflicting} of {cov}."
+                )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            level_means.append(
+                np.where(
+                    has_zero,
+                    sum_zero_var_means / num_zero,
+                    sum_weighted_means / sum_inv_vars,
+                )
             )
-    return pd.DataFrame(formatted_vals, columns=["Name", "Level", "Beta", "SE"])
+            level_vars.append(np.where(has_zero, 0.0, np.divide(1.0, sum_inv_vars)))
+        names.extend([cov] * num_levels)
+        levels.extend(uniques)
+
+    if len(levels) == 0:
+        return pd.DataFrame([], columns=["Name", "Level", "Beta", "SE"])
+    effects, effect_sems = relativize(
+        np.concatenate(level_means),
+        np.sqrt(np.concatenate(level_vars)),
+        overall_mean,
+        overall_sem,
+        cov_means=0.0,
+        as_percent=True,
+    )
+    return pd.DataFrame(
+        {"Name": names, "Level": levels, "Beta": effects, "SE": effect_sems},
+        columns=["Name", "Level", "Beta", "SE"],
+    )
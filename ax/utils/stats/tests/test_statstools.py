@@ -67,3 +67,52 @@ class MarginalEffectsTest(TestCase):
         fx = marginal_effects(df)
         self.assertTrue(np.allclose(fx["Beta"].values, [-40, 40, -20, 20], atol=1e-3))
         self.assertTrue(np.allclose(fx["SE"].values, [2.83] * 4, atol=1e-2))
+
+    def test_marginal_effects_zero_sem(self) -> None:
+        df = pd.DataFrame(
+            {
+                "mean": [1, 2, 3, 4],
+                "sem": [0.0, 0.1, 0.1, 0.1],
+                "factor": ["a", "a", "b", "b"],
+            }
+        )
+        fx = marginal_effects(df)
+        # Both the baseline and level "a" are the zero-SEM observation itself.
+        self.assertEqual(fx["Level"].tolist(), ["a", "b"])
+        self.assertTrue(np.allclose(fx["Beta"].values, [0.0, 250.0]))
+        self.assertTrue(np.allclose(fx["SE"].values, [0.0, np.sqrt(0.005) * 100]))
+
+    def test_marginal_effects_conflicting_zero_sem(self) -> None:
+        df = pd.DataFrame(
+            {
+                "mean": [1, 2, 3, 4],
+                "sem": [0.0, 0.0, 0.1, 0.1],
+                "factor": ["a", "a", "b", "b"],
+            }
+        )
+        with self.assertLogs("ax.utils.stats.statstools", level="WARNING") as logs:
+            fx = marginal_effects(df)
+        self.assertTrue(
+            any("for levels ['a'] of factor" in output for output in logs.output)
+        )
+        # Level "a" reports the mean of its conflicting zero-SEM observations.
+        self.assertTrue(np.allclose(fx["Beta"].values, [0.0, 200 / 1.5]))
+
+    def test_marginal_effects_nan_level(self) -> None:
+        df = pd.DataFrame(
+            {
+                "mean": [1, 2, 3, 4],
+                "sem": [0.1, 0.1, 0.1, 0.1],
+                "factor": ["a", "a", np.nan, "b"],
+            }
+        )
+        fx = marginal_effects(df)
+        # Observations with a missing level count towards the baseline only.
+        self.assertEqual(fx["Level"].tolist(), ["a", "b"])
+        self.assertTrue(np.allclose(fx["Beta"].values, [-40, 60], atol=1e-3))
+
+    def test_marginal_effects_single_level(self) -> None:
+        df = pd.DataFrame({"mean": [1, 2], "sem": [0.1, 0.1], "factor": ["a", "a"]})
+        fx = marginal_effects(df)
+        self.assertTrue(fx.empty)
+        self.assertEqual(list(fx.columns), ["Name", "Level", "Beta", "SE"])